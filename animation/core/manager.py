@@ -21,7 +21,12 @@ from animation.core import AnimationBase, RenderedFrame, StatefulAnimationBase,
 from animation.core.defaults import DEFAULT_ANIMATION_SPEED_SCALE, DEFAULT_PLANT_AWARE
 from animation.core.plant_awareness import PlantModifierState
 from drivers.led_layout import DEFAULT_STRIP_COUNT, DEFAULT_LEDS_PER_STRIP
-from drivers.frame_codec import encode_frame_data, FRAME_ENCODING_NAME
+from drivers.frame_codec import encode_rgb_frame, RGB_FRAME_ENCODING_NAME
+
+MOCK_DEBUG_FRAME_INTERVAL = 100
+# Frames the loop may fall behind its cadence before it stops trying to catch
+# up and re-anchors the schedule at the current time.
+MAX_PACING_LAG_FRAMES = 3
 
 # Try to import the real LED controller, fall back to mock for testing
 try:
@@ -37,11 +42,16 @@ except ImportError:
                 self.leds_per_strip = leds_per_strip
                 self.total_leds = strips * leds_per_strip
                 self.debug = kwargs.get('debug', False)
+                self.inline_show = True
+                self._frames_seen = 0
                 print(f"🔧 Mock LED Controller: {strips} strips × {leds_per_strip} LEDs = {self.total_leds} total")
 
             def set_all_pixels(self, pixel_data):
                 """Mock set all pixels"""
-                if self.debug and len(pixel_data) > 0:
+                self._frames_seen += 1
+                # Sample the log; a formatted print per frame would dominate
+                # the mock's cost at LED frame rates.
+                if self.debug and len(pixel_data) > 0 and self._frames_seen % MOCK_DEBUG_FRAME_INTERVAL == 1:
                     r, g, b = pixel_data[0]
                     print(f"📊 Frame: First pixel = RGB({r}, {g}, {b})")
 
@@ -71,7 +81,7 @@ class PreviewLEDController:
         self.total_leds = strips * leds_per_strip
         self.debug = debug
 
-    def set_all_pixels(self, *_args, **_kwargs):
+    def set_all_pixels(self, colors):
         pass
 
     def set_pixel(self, *_args, **_kwargs):
@@ -83,10 +93,10 @@ class PreviewLEDController:
     def set_brightness(self, *_args, **_kwargs):
         pass
 
-    def show(self, *_args, **_kwargs):
+    def show(self):
         pass
 
-    def clear(self, *_args, **_kwargs):
+    def clear(self):
         pass
 
     def configure(self, *_args, **_kwargs):
@@ -635,12 +645,11 @@ class AnimationManager:
         """Get current animation frame data for web rendering"""
         with self.frame_data_lock:
             raw = self.current_frame_data
-            if isinstance(raw, np.ndarray):
-                frame_data = raw.tolist()
-            else:
-                frame_data = list(raw)
+            # Pack straight from the frame buffer; building per-pixel lists
+            # and JSON text here dominated the cost of a status poll.
+            frame_data = np.array(raw, dtype=np.uint8).reshape(-1, 3)
 
-        encoded_frame = encode_frame_data(frame_data)
+        encoded_frame = encode_rgb_frame(frame_data)
         mode = 'animation' if self.is_running else ('painter' if self.painter_active else 'idle')
         displayed_animation = self.current_animation_name if self.is_running else (
             'frame_painter' if self.painter_active else None
@@ -649,7 +658,7 @@ class AnimationManager:
         return {
             'frame_data_encoded': encoded_frame,
             'frame_data_length': len(frame_data),
-            'frame_encoding': FRAME_ENCODING_NAME if encoded_frame else None,
+            'frame_encoding': RGB_FRAME_ENCODING_NAME if encoded_frame else None,
             'mode': mode,
             'painter_active': self.painter_active,
             'led_info': {
@@ -809,6 +818,9 @@ class AnimationManager:
         """Main animation loop running in separate thread"""
         inline_show = getattr(self.controller, "inline_show", False)
         pending_present = None
+        # Frames are paced against absolute deadlines, so an occasional slow
+        # frame is absorbed by shorter sleeps instead of shifting the cadence.
+        deadline = None
 
         # One presentation may overlap generation of the next frame. We resolve
         # it before the animation can rotate back to the same one of its two
@@ -866,9 +878,13 @@ class AnimationManager:
                     traceback.print_exc()
                     time.sleep(0.05)
 
-                loop_duration = time.perf_counter() - loop_start
+                now = time.perf_counter()
+                loop_duration = now - loop_start
                 target_frame_time = 1.0 / max(1, int(self.target_fps) or 1)
-                sleep_time = max(0.0, target_frame_time - loop_duration)
+                deadline = (loop_start if deadline is None else deadline) + target_frame_time
+                if now - deadline > MAX_PACING_LAG_FRAMES * target_frame_time:
+                    deadline = now
+                sleep_time = max(0.0, deadline - now)
                 if sleep_time > 0:
                     time.sleep(sleep_time)
 
@@ -21,7 +21,7 @@ from animation.core.manager import AnimationManager
 from animation.plugins.rainbow import RainbowAnimation
 from animation.plugins.solid import SolidColorAnimation
 from drivers.multi_device import MultiDeviceLEDController
-from drivers.spi_controller import CRC_BYTES, LEDController
+from drivers.spi_controller import CMD_SET_RANGE, CMD_SHOW, CRC_BYTES, LEDController
 from drivers.spi_controller import RECEIVER_STATUS_BYTES
 from drivers.spi_controller import RECEIVER_STATUS_BYTES_V2
 from tools.benchmarks.receiver_acceptance import evaluate_samples
@@ -208,6 +208,10 @@ class _SPI:
         self.calls.append(bytes(data))
         return [0] * len(data)
 
+    def writebytes2(self, data):
+        self.calls.append(bytes(data))
+        self.write_only_calls = getattr(self, 'write_only_calls', 0) + 1
+
 
 class DriverBufferTests(unittest.TestCase):
     def _driver(self):
@@ -217,6 +221,7 @@ class DriverBufferTests(unittest.TestCase):
         driver.leds_per_strip = 4
         driver.spi = _SPI()
         driver._frame_packet = bytearray(1 + driver.total_leds * 3 + CRC_BYTES)
+        driver._range_packets = {}
         driver._bytes_sent = 0
         driver._crc_bytes_sent = 0
         driver._spi_transfers = 0
@@ -244,6 +249,61 @@ class DriverBufferTests(unittest.TestCase):
                 binascii.crc_hqx(payload, 0xFFFF),
             )
 
+    def test_range_packets_are_reused_per_pixel_count(self):
+        driver = self._driver()
+        frame = np.arange(12, dtype=np.uint8).reshape(4, 3)
+
+        driver.set_range(0, frame[0:2])
+        driver.set_range(2, frame[2:4])
+
+        self.assertEqual(list(driver._range_packets), [2])
+        first, second = driver.spi.calls[:2]
+        self.assertEqual(first[:4], bytes([CMD_SET_RANGE, 0, 0, 2]))
+        self.assertEqual(second[:4], bytes([CMD_SET_RANGE, 0, 2, 2]))
+        self.assertEqual(second[4:10], frame[2:4].tobytes())
+        self.assertEqual(
+            int.from_bytes(second[-2:], "big"),
+            binascii.crc_hqx(second[:-2], 0xFFFF),
+        )
+
+    def test_malformed_ranges_raise_without_resizing_the_reused_packet(self):
+        driver = self._driver()
+        frame = np.arange(12, dtype=np.uint8).reshape(4, 3)
+        driver.set_range(0, frame)
+        packet_length = len(driver._range_packets[4])
+
+        for colors in (np.zeros((4, 4), dtype=np.uint8), [(1, 2, 3)] * 3 + [(4, 5)]):
+            with self.assertRaises(ValueError):
+                driver.set_range(0, colors)
+        self.assertEqual(len(driver._range_packets[4]), packet_length)
+
+        driver.set_range(0, frame)
+        self.assertEqual(driver.spi.calls[-1], driver.spi.calls[0])
+
+    def test_partial_frame_coalesces_nearby_dirty_ranges(self):
+        driver = self._driver()
+        frame = np.arange(12, dtype=np.uint8).reshape(4, 3)
+
+        driver.set_partial_frame(frame, [(3, 4), (0, 1)])
+
+        self.assertEqual(len(driver.spi.calls), 2)
+        self.assertEqual(driver.spi.calls[0][:4], bytes([CMD_SET_RANGE, 0, 0, 4]))
+        self.assertEqual(driver.spi.calls[0][4:-2], frame.tobytes())
+
+    def test_short_control_packets_skip_miso_readback(self):
+        driver = self._driver()
+        driver.total_leds = 20
+        driver._frame_packet = bytearray(1 + driver.total_leds * 3 + CRC_BYTES)
+
+        driver.show()
+        driver.set_all_pixels(np.zeros((20, 3), dtype=np.uint8))
+
+        self.assertEqual(driver.spi.write_only_calls, 1)
+        self.assertEqual(driver.spi.calls[0], bytes([CMD_SHOW]) + (
+            binascii.crc_hqx(bytes([CMD_SHOW]), 0xFFFF).to_bytes(2, "big")
+        ))
+        self.assertEqual(len(driver.spi.calls), 2)
+
     def test_receiver_status_is_parsed_from_miso(self):
         driver = self._driver()
         response = [0] * RECEIVER_STATUS_BYTES
@@ -86,6 +86,13 @@ class ChristmasTreeAnimation(AnimationBase):
         self._light_nodes: List[Dict[str, Any]] = []
         self._garland_pixels: List[Tuple[int, int, float]] = []
         self._snow_cap_pixels: List[Tuple[int, int]] = []
+        # Column arrays mirroring _tree_pixels and _snow_cap_pixels, with the
+        # static tree shading baked in, so drawing is a single scatter.
+        self._tree_xs = np.zeros(0, dtype=np.intp)
+        self._tree_ys = np.zeros(0, dtype=np.intp)
+        self._tree_colors = np.zeros((0, 3), dtype=np.uint8)
+        self._snow_cap_xs = np.zeros(0, dtype=np.intp)
+        self._snow_cap_ys = np.zeros(0, dtype=np.intp)
         self._ground_noise: List[float] = []
         self._snow_depth = 4
         self._snow_start_y = max(0, self.height - self._snow_depth)
@@ -267,8 +274,24 @@ class ChristmasTreeAnimation(AnimationBase):
             if (x, y - 1) not in tree_set and (x + y) % 2 == 0
         ]
         self._ground_noise = [self.random.random() * math.tau for _ in range(self.width)]
+        self._prepare_tree_arrays(palette_name)
         self._background_cache_key = ()
 
+    def _prepare_tree_arrays(self, palette_name: str) -> None:
+        tree = np.array(self._tree_pixels, dtype=np.float64).reshape(-1, 3)
+        self._tree_xs = tree[:, 0].astype(np.intp)
+        self._tree_ys = tree[:, 1].astype(np.intp)
+        palette = self.PALETTES[palette_name]
+        bright = np.array(palette["tree"], dtype=np.float64)
+        dark = np.array(palette["tree_dark"], dtype=np.float64)
+        wave = .08 * np.sin(tree[:, 0] * 1.3 + tree[:, 1] * .27)
+        mix = np.clip(.42 + tree[:, 2] * .45 + wave, .18, 1.0)
+        colors = np.rint(dark + (bright - dark) * mix[:, None])
+        self._tree_colors = np.clip(colors, 0, 255).astype(np.uint8)
+        caps = np.array(self._snow_cap_pixels, dtype=np.intp).reshape(-1, 2)
+        self._snow_cap_xs = caps[:, 0]
+        self._snow_cap_ys = caps[:, 1]
+
     def _prepare_plant_layers(self) -> None:
         self._plant_foliage.fill(False)
         self._plant_globes.fill(False)
@@ -440,21 +463,17 @@ class ChristmasTreeAnimation(AnimationBase):
                 self._paint(x, y, (value, min(255, value + 4), min(255, value + 18)))
 
     def _draw_tree(self) -> None:
-        palette = self.PALETTES[self._choice("tree_palette", self.TREE_PALETTES, "classic")]
-        bright = palette["tree"]
-        dark = palette["tree_dark"]
-        for x, y, progress in self._tree_pixels:
-            if self.plant_aware_enabled() and self._plant_obstacle[x, y]:
-                continue
-            wave = .08 * math.sin(x * 1.3 + y * .27)
-            mix = max(.18, min(1.0, .42 + progress * .45 + wave))
-            color = tuple(round(dark[i] + (bright[i] - dark[i]) * mix) for i in range(3))
-            self._paint(x, y, color)
+        xs, ys, colors = self._tree_xs, self._tree_ys, self._tree_colors
+        if self.plant_aware_enabled():
+            visible = ~self._plant_obstacle[xs, ys]
+            xs, ys, colors = xs[visible], ys[visible], colors[visible]
+        self._logical[xs, ys] = colors
         if self._choice("tree_palette", self.TREE_PALETTES, "classic") == "frost":
-            for x, y in self._snow_cap_pixels:
-                if self.plant_aware_enabled() and self._plant_obstacle[x, y]:
-                    continue
-                self._paint(x, y, (178, 224, 232))
+            xs, ys = self._snow_cap_xs, self._snow_cap_ys
+            if self.plant_aware_enabled():
+                visible = ~self._plant_obstacle[xs, ys]
+                xs, ys = xs[visible], ys[visible]
+            self._logical[xs, ys] = (178, 224, 232)
 
     def _draw_trunk(self) -> None:
         for x, y in self._trunk_pixels:
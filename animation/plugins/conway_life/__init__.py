@@ -16,6 +16,10 @@ from drivers.led_layout import DEFAULT_LEDS_PER_STRIP, DEFAULT_STRIP_COUNT
 
 Color = Tuple[int, int, int]
 
+NEIGHBOR_OFFSETS = tuple(
+    (dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx
+)
+
 
 class ConwayLifeAnimation(AnimationBase):
     """Conway's Game of Life with smooth transitions and color blending."""
@@ -130,6 +134,9 @@ class ConwayLifeAnimation(AnimationBase):
             [None for _ in range(self.width)] for _ in range(self.height)
         ]
         self.neighbor_counts: List[List[int]] = [[0 for _ in range(self.width)] for _ in range(self.height)]
+        # Templates for clearing the back buffers row by row with slice copies.
+        self._zero_row: List[int] = [0] * self.width
+        self._empty_row: List[Optional[Color]] = [None] * self.width
 
         self.generation = 0
         self.alive_cells = 0
@@ -179,6 +186,12 @@ class ConwayLifeAnimation(AnimationBase):
         self._loop_order: Deque[Tuple[Tuple[int, int], int]] = deque()
         self._next_state_fingerprint: Tuple[int, int] = (0, 0)
         self._tile_ids: Optional[List[List[int]]] = None
+        self._tile_id_array: Optional[np.ndarray] = None
+        self._tile_neighbor_masks: Optional[Dict[Tuple[int, int], np.ndarray]] = None
+        # Occupancy with a one-cell halo (wrapped or empty) so every neighbour
+        # direction is a plain view, and a reused count buffer.
+        self._occupancy_halo = np.zeros((self.height + 2, self.width + 2), dtype=bool)
+        self._neighbor_count_buffer = np.zeros((self.height, self.width), dtype=np.int16)
         self._tile_regions: List[Tuple[int, int, int, int]] = []
         self._plant_blocked = np.zeros((self.height, self.width), dtype=bool)
         self._plant_hazard = np.zeros((self.height, self.width), dtype=bool)
@@ -638,8 +651,10 @@ class ConwayLifeAnimation(AnimationBase):
             self.phase_frame = 0
             return
 
-        self.grid = [row[:] for row in self.next_grid]
-        self.natural_grid = [row[:] for row in self.next_natural_grid]
+        # Ping-pong the buffers; every path below recomputes the next state,
+        # which clears the stale back buffers in place.
+        self.grid, self.next_grid = self.next_grid, self.grid
+        self.natural_grid, self.next_natural_grid = self.next_natural_grid, self.natural_grid
         self.generation += 1
         self.plant_hazard_deaths += self._next_plant_hazard_deaths
         self._emit_plant_cells()
@@ -670,9 +685,12 @@ class ConwayLifeAnimation(AnimationBase):
 
     def _compute_next_state(self):
         wrap = bool(self.params.get("wrap_edges", True)) and self._tile_ids is None
-        self.next_grid = [[0 for _ in range(self.width)] for _ in range(self.height)]
-        self.next_natural_grid = [[None for _ in range(self.width)] for _ in range(self.height)]
-        self.neighbor_counts = [[0 for _ in range(self.width)] for _ in range(self.height)]
+        zero_row = self._zero_row
+        empty_row = self._empty_row
+        for row in self.next_grid:
+            row[:] = zero_row
+        for row in self.next_natural_grid:
+            row[:] = empty_row
 
         births = 0
         deaths = 0
@@ -680,38 +698,13 @@ class ConwayLifeAnimation(AnimationBase):
         hazard_deaths = 0
         next_fingerprint = 14695981039346656037
         render_cells: List[Tuple[int, int]] = []
-        alive_cells = {
-            (x, y)
-            for y, row in enumerate(self.grid)
-            for x, value in enumerate(row)
-            if value > 0
-        }
-        counts: Dict[Tuple[int, int], int] = {}
-        for x, y in alive_cells:
-            source_tile = self._tile_ids[y][x] if self._tile_ids is not None else 0
-            for dy in (-1, 0, 1):
-                for dx in (-1, 0, 1):
-                    if dx == 0 and dy == 0:
-                        continue
-                    nx = x + dx
-                    ny = y + dy
-                    if wrap:
-                        nx %= self.width
-                        ny %= self.height
-                    elif not (0 <= nx < self.width and 0 <= ny < self.height):
-                        continue
-                    if self._tile_ids is not None and self._tile_ids[ny][nx] != source_tile:
-                        continue
-                    if self._obstacle_enabled() and self._plant_blocked[ny, nx]:
-                        continue
-                    key = (nx, ny)
-                    counts[key] = counts.get(key, 0) + 1
-
-        candidates = sorted(alive_cells | counts.keys(), key=lambda cell: (cell[1], cell[0]))
-        for x, y in candidates:
-            neighbors = counts.get((x, y), 0)
-            self.neighbor_counts[y][x] = neighbors
-            alive = (x, y) in alive_cells
+        occupied = np.asarray(self.grid) > 0
+        counts = self._neighbor_count_array(occupied, wrap)
+        self.neighbor_counts = counts.tolist()
+        candidate_rows, candidate_cols = np.nonzero(occupied | (counts > 0))
+        for y, x in zip(candidate_rows.tolist(), candidate_cols.tolist()):
+            neighbors = self.neighbor_counts[y][x]
+            alive = self.grid[y][x] > 0
 
             if alive and neighbors in (2, 3):
                 self.next_grid[y][x] = min(self.grid[y][x] + 1, 20)
@@ -775,6 +768,40 @@ class ConwayLifeAnimation(AnimationBase):
         self._next_plant_hazard_deaths = hazard_deaths
         self._next_state_fingerprint = (next_fingerprint, next_population)
 
+    def _neighbor_count_array(self, occupied: np.ndarray, wrap: bool) -> np.ndarray:
+        """Count live neighbours with one halo-view add per direction.
+
+        A live cell contributes to a neighbour only inside the same tile, and
+        obstacle cells never receive counts. The returned buffer is reused.
+        """
+        height, width = occupied.shape
+        halo = self._occupancy_halo
+        halo[1:-1, 1:-1] = occupied
+        if wrap:
+            halo[0, 1:-1] = occupied[-1]
+            halo[-1, 1:-1] = occupied[0]
+            halo[:, 0] = halo[:, -2]
+            halo[:, -1] = halo[:, 1]
+        else:
+            halo[0, :] = False
+            halo[-1, :] = False
+            halo[:, 0] = False
+            halo[:, -1] = False
+
+        counts = self._neighbor_count_buffer
+        counts.fill(0)
+        tile_masks = self._tile_neighbor_masks
+        for dy, dx in NEIGHBOR_OFFSETS:
+            # Cell (y, x) receives from its neighbour at (y - dy, x - dx).
+            source = halo[1 - dy:1 - dy + height, 1 - dx:1 - dx + width]
+            if tile_masks is None:
+                counts += source
+            else:
+                counts += source & tile_masks[(dy, dx)]
+        if self._obstacle_enabled():
+            counts[self._plant_blocked] = 0
+        return counts
+
     def _fingerprint_grid(self) -> Tuple[int, int]:
         """Return a compact fingerprint of logical occupancy, excluding visual age/color."""
         fingerprint = 14695981039346656037
@@ -1134,6 +1161,8 @@ class ConwayLifeAnimation(AnimationBase):
         self._background_cache = None
         if not bool(self.params.get("tile_installation", False)):
             self._tile_ids = None
+            self._tile_id_array = None
+            self._tile_neighbor_masks = None
             self._tile_regions = []
             self._tile_active_mask = None
             return
@@ -1161,8 +1190,17 @@ class ConwayLifeAnimation(AnimationBase):
                         tile_ids[y][x] = tile_id
 
         self._tile_ids = tile_ids
+        self._tile_id_array = np.asarray(tile_ids, dtype=np.int16)
+        # Per direction, whether the source neighbour shares the cell's tile.
+        # -2 marks off-grid sources; gutter cells are -1 and match each other.
+        tile_halo = np.pad(self._tile_id_array, 1, constant_values=-2)
+        self._tile_neighbor_masks = {
+            (dy, dx): tile_halo[1 - dy:1 - dy + self.height, 1 - dx:1 - dx + self.width]
+            == self._tile_id_array
+            for dy, dx in NEIGHBOR_OFFSETS
+        }
         self._tile_regions = regions
-        self._tile_active_mask = np.asarray(tile_ids, dtype=np.int16) >= 0
+        self._tile_active_mask = self._tile_id_array >= 0
 
     def _cell_is_active(self, x: int, y: int) -> bool:
         if not (0 <= x < self.width and 0 <= y < self.height):
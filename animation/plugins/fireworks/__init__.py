@@ -235,11 +235,12 @@ class FireworksAnimation(AnimationBase):
     def _rebuild_stars(self):
         self._stars = np.zeros((self.height, self.width), dtype=np.float32)
         density = min(0.08, max(0.0, float(self.params.get("star_density", 0.012))))
-        star_rng = random.Random(self._seed ^ 0x5A17)
-        for y in range(self.height):
-            for x in range(self.width):
-                if star_rng.random() < density:
-                    self._stars[y, x] = star_rng.uniform(0.08, 0.32)
+        # One batched draw for the whole sky rather than a Python RNG call
+        # per cell; a separate generator keeps the show's _rng untouched.
+        # numpy seeds must be non-negative, unlike random.Random's.
+        star_rng = np.random.default_rng((self._seed ^ 0x5A17) & 0xFFFFFFFF)
+        lit = star_rng.random((self.height, self.width)) < density
+        self._stars[lit] = star_rng.uniform(0.08, 0.32, int(np.count_nonzero(lit)))
 
     def _launch_rockets(self, dt: float):
         rate = max(0.0, float(self.params.get("launch_rate", 0.75)))
@@ -327,6 +328,12 @@ class FireworksAnimation(AnimationBase):
         trail_intensity = max(0.0, float(self.params.get("trail_intensity", 1.0)))
         survivors: List[Spark] = []
         children: List[Spark] = []
+        # Light samples are gathered here and splatted into the trail in one
+        # vectorized pass after the loop.
+        sample_xs: List[float] = []
+        sample_ys: List[float] = []
+        sample_colors: List[Color] = []
+        sample_weights: List[float] = []
         for spark in self._sparks:
             spark.age += dt
             old_x, old_y = spark.x, spark.y
@@ -353,8 +360,13 @@ class FireworksAnimation(AnimationBase):
                 continue
             fade = (1.0 - life) ** 1.35
             shimmer = 1.0 - twinkle + twinkle * (0.35 + 0.65 * abs(math.sin(time_elapsed * 25.0 + spark.x * 31.0)))
-            self._deposit(spark.x, spark.y, spark.color, fade * shimmer * spark.size * trail_intensity)
+            sample_xs.append(spark.x)
+            sample_ys.append(spark.y)
+            sample_colors.append(spark.color)
+            sample_weights.append(fade * shimmer * spark.size * trail_intensity)
             survivors.append(spark)
+        if sample_xs:
+            self._deposit_many(sample_xs, sample_ys, sample_colors, sample_weights)
         # Keep pathological live parameter combinations bounded.
         # Plant collision sampling has a little extra cost, and masked sparks
         # contribute less useful light, so retain a smaller stress-path cloud.
@@ -402,6 +414,41 @@ class FireworksAnimation(AnimationBase):
                     pixel[1] += green * weight
                     pixel[2] += blue * weight
 
+    def _deposit_many(
+        self,
+        xs: List[float],
+        ys: List[float],
+        colors: List[Color],
+        intensities: List[float],
+    ):
+        """Vectorized _deposit for a batch of sparks, summed with np.add.at."""
+        x = np.asarray(xs, dtype=np.float64)
+        y = np.asarray(ys, dtype=np.float64)
+        intensity = np.asarray(intensities, dtype=np.float64)
+        keep = (intensity > 0.0) & (x >= 0.0) & (x <= 1.0) & (y >= 0.0) & (y <= 1.0)
+        if not np.any(keep):
+            return
+        px = x[keep] * max(0, self.width - 1)
+        py = y[keep] * max(0, self.height - 1)
+        light = np.asarray(colors, dtype=np.float64)[keep] * intensity[keep, None]
+        x0 = px.astype(np.intp)
+        y0 = py.astype(np.intp)
+        fx = px - x0
+        fy = py - y0
+        for dy, wy in ((0, 1.0 - fy), (1, fy)):
+            for dx, wx in ((0, 1.0 - fx), (1, fx)):
+                rows = y0 + dy
+                columns = x0 + dx
+                weight = wx * wy
+                hits = np.flatnonzero((rows < self.height) & (columns < self.width) & (weight > 0.0))
+                if self._plant_active:
+                    hits = hits[~self._plant_obstacle[rows[hits], columns[hits]]]
+                np.add.at(
+                    self._trail,
+                    (rows[hits], columns[hits]),
+                    light[hits] * weight[hits, None],
+                )
+
     def _refresh_plant_geometry(self):
         masks = self.get_plant_masks()
         if masks is self._plant_geometry:
@@ -49,6 +49,11 @@ class FireworksAnimationTests(unittest.TestCase):
             right_frame = right.generate_frame(frame / 60, frame)
             np.testing.assert_array_equal(left_frame, right_frame)
 
+    def test_negative_seed_is_accepted(self):
+        animation = FireworksAnimation(_Controller(), {"random_seed": -5, "star_density": 0.02})
+        animation.update_parameters({"random_seed": -6})
+        self.assertEqual(animation.generate_frame(0.0, 0).shape[-1], 3)
+
     def test_schema_exposes_shape_color_and_physics_controls(self):
         schema = FireworksAnimation(_Controller()).get_parameter_schema()
         for parameter in (
@@ -36,6 +36,7 @@ class FluidTankAnimation(AnimationBase):
     ANIMATION_VERSION = "2.0"
     PLANT_MODIFIER_SUPPORT = frozenset(("obstacle", "refract", "slow_zone"))
     CC_PER_CELL = 5.0
+    MAX_SPRAY_PARTICLES = 80
 
     def __init__(self, controller, config: Dict[str, Any] = None):
         super().__init__(controller, config)
@@ -122,6 +123,7 @@ class FluidTankAnimation(AnimationBase):
         self.volume_cells = 0.0
         self.surface_offset = np.zeros(self.width, dtype=np.float32)
         self.surface_velocity = np.zeros(self.width, dtype=np.float32)
+        self._surface_laplacian = np.zeros(self.width, dtype=np.float32)
         self.water = np.zeros((self.height, self.width), dtype=np.int8)  # compatibility/debug view
         self.last_time: Optional[float] = None
         self.fill_cycle_start_time = 0.0
@@ -132,7 +134,11 @@ class FluidTankAnimation(AnimationBase):
         self.bubble_accumulator = 0.0
         self.holes: List[Hole] = []
         self.patch_flashes: List[Dict[str, float]] = []
-        self.spray_particles: List[Dict[str, float]] = []
+        # Spray is a fixed pool kept as structure-of-arrays (x, y, vx, vy,
+        # life rows); live droplets are packed into the first spray_count
+        # columns so stepping and culling are whole-array operations.
+        self._spray = np.zeros((5, self.MAX_SPRAY_PARTICLES), dtype=np.float64)
+        self.spray_count = 0
         self.hole_cooldown_timer = 0.0
         self.max_bubble_rise = 0.0
         self.last_spray_time = 0.0
@@ -144,6 +150,7 @@ class FluidTankAnimation(AnimationBase):
         self._yy = np.arange(self.height, dtype=np.float32)[:, None]
         self._xx = np.arange(self.width, dtype=np.float32)[None, :]
         self._row_centers = self._yy + 0.5
+        self._coverage = np.zeros((self.height, self.width), dtype=np.float32)
         self._edge_light = np.clip(
             1.0 - np.minimum(self._xx, self.width - 1.0 - self._xx) / 1.5,
             0.0,
@@ -151,6 +158,12 @@ class FluidTankAnimation(AnimationBase):
         )
         self._caustic_cache = np.zeros((self.height, self.width), dtype=np.float32)
         self._caustic_cache_time = -1.0
+        # Scratch planes for the water-body pass, refilled with ``out=`` each
+        # refresh instead of allocating fresh height x width temporaries.
+        self._depth = np.zeros((self.height, self.width), dtype=np.float32)
+        self._depth_t = np.zeros_like(self._depth)
+        self._surface_band = np.zeros_like(self._depth)
+        self._light_plane = np.zeros_like(self._depth)
         xs = np.arange(self.width, dtype=np.int32)[None, :]
         ys = np.arange(self.height, dtype=np.int32)[:, None]
         normal_led = self.height - 1 - np.broadcast_to(ys, (self.height, self.width))
@@ -162,16 +175,23 @@ class FluidTankAnimation(AnimationBase):
         self._normal_flat_idx = (xs * self.panel_leds_per_strip + normal_led).ravel()
         self._serpentine_flat_idx = (xs * self.panel_leds_per_strip + serpentine_led).ravel()
         self._water_grid_cache = np.zeros((self.height, self.width, 3), dtype=np.float32)
+        # Per-frame working copy of the cached body; overlays draw into it.
+        self._frame_grid = np.zeros_like(self._water_grid_cache)
         self._water_grid_cache_time = -1.0
         self._plant_foliage = np.zeros((self.height, self.width), dtype=bool)
         self._plant_globes = np.zeros((self.height, self.width), dtype=bool)
         self._plant_clearance = np.zeros((self.height, self.width), dtype=bool)
         self._plant_obstacle = np.zeros((self.height, self.width), dtype=bool)
+        self._plant_clear_column = np.repeat(
+            np.arange(self.width, dtype=np.intp)[None, :], self.height, axis=0
+        )
         self._plant_distance = np.full((self.height, self.width), float(max(self.width, self.height)), dtype=np.float32)
         self._plant_normal_row = np.zeros((self.height, self.width), dtype=np.float32)
         self._plant_normal_col = np.zeros((self.height, self.width), dtype=np.float32)
         self._plant_geometry_identity = None
         self._plant_mask_error = ''
+        self._plant_foliage_pixels = 0
+        self._plant_globe_pixels = 0
         self._plant_flow_deflections = 0
         self._plant_slow_zone_steps = 0
         self._plant_slow_zone_seconds = 0.0
@@ -208,7 +228,7 @@ class FluidTankAnimation(AnimationBase):
         self._maybe_reset_cycle(time_elapsed)
 
         coverage, surface_y = self._coverage_and_surface()
-        self.water = (coverage >= 0.5).astype(np.int8)
+        np.greater_equal(coverage, 0.5, out=self.water)
         self._snapshot_stats(time_elapsed, dt_real, surface_y)
         return self._render_frame(time_elapsed, coverage, surface_y)
 
@@ -230,9 +250,39 @@ class FluidTankAnimation(AnimationBase):
         np.divide(col_gradient, magnitude, out=self._plant_normal_col, where=magnitude > 0)
         self._plant_geometry_identity = id(masks)
         self._plant_mask_error = masks.error
+        # Counted once per mask rather than in every stats snapshot.
+        self._plant_foliage_pixels = int(np.count_nonzero(self._plant_foliage))
+        self._plant_globe_pixels = int(np.count_nonzero(self._plant_globes))
+        self._prepare_plant_clear_columns()
         self._prepare_plant_refraction()
         self._water_grid_cache_time = -1.0
 
+    def _prepare_plant_clear_columns(self) -> None:
+        """Tabulate the nearest clear column for every cell, or -1 if none.
+
+        Search order matches the original per-particle scan: origin - d before
+        origin + d, growing d. Geometry changes rarely, so this runs once per
+        mask instead of once per routed droplet or bubble.
+        """
+        clear = ~self._plant_clearance
+        nearest = np.where(clear, np.arange(self.width, dtype=np.intp)[None, :], -1)
+        pending = ~clear
+        candidate_clear = np.empty_like(clear)
+        for distance in range(1, self.width):
+            if not pending.any():
+                break
+            for shift in (-distance, distance):
+                candidate_clear.fill(False)
+                if shift < 0:
+                    candidate_clear[:, distance:] = clear[:, :-distance]
+                else:
+                    candidate_clear[:, :-distance] = clear[:, distance:]
+                found = pending & candidate_clear
+                rows, cols = np.nonzero(found)
+                nearest[rows, cols] = cols + shift
+                pending &= ~found
+        self._plant_clear_column[:] = nearest
+
     def _prepare_plant_refraction(self) -> None:
         strength = self.plant_modifier_strength('refract')
         radius = max(2.0, float(self.params.get('plant_clearance', 1)) + 4.0)
@@ -268,19 +318,17 @@ class FluidTankAnimation(AnimationBase):
         )
         if strength <= 0.0:
             return x
-        for distance in range(1, self.width):
-            # Prefer the side the particle was already closest to, then remain
-            # deterministic when it is exactly centered on a diffuser cell.
-            candidates = (origin - distance, origin + distance)
-            for candidate in candidates:
-                if 0 <= candidate < self.width and not self._plant_clearance[row, candidate]:
-                    self._plant_flow_deflections += 1
-                    target = float(candidate)
-                    # Exact cores stay solid at every enabled strength. Strength
-                    # controls how assertively the surrounding clearance routes.
-                    effective = 1.0 if self._plant_obstacle[row, origin] else min(1.0, strength)
-                    return x + (target - x) * effective
-        return x
+        # The table prefers the lower column on ties, so a particle exactly
+        # centered on a diffuser cell routes deterministically.
+        candidate = int(self._plant_clear_column[row, origin])
+        if candidate < 0:
+            return x
+        self._plant_flow_deflections += 1
+        target = float(candidate)
+        # Exact cores stay solid at every enabled strength. Strength
+        # controls how assertively the surrounding clearance routes.
+        effective = 1.0 if self._plant_obstacle[row, origin] else min(1.0, strength)
+        return x + (target - x) * effective
 
     def _legacy_plant_mode(self) -> bool:
         raw_state = self.params.get('plant_modifiers') or {}
@@ -325,14 +373,16 @@ class FluidTankAnimation(AnimationBase):
         max_rate = max(30.0, float(self.params.get('max_drop_rate', 240.0)))
         spawn_rate = min(flow_cells_s, max_rate)
         packet_volume = max(1.0, flow_cells_s / max(spawn_rate, 1.0))
+        # Bound once: the shared module generator keeps seeded runs identical.
+        uniform = random.uniform
         while self.inlet_reservoir_cells + 1e-9 >= packet_volume and len(self.inlet_particles) < 512:
             self.inlet_reservoir_cells -= packet_volume
-            x = random.uniform(self.width * 0.25, self.width * 0.75)
+            x = uniform(self.width * 0.25, self.width * 0.75)
             if self._obstacle_enabled():
                 x = self._nearest_clear_x(x, 0.0)
             self.inlet_particles.append({
-                'x': x, 'y': -random.uniform(0.0, 1.5),
-                'vy': random.uniform(0.0, 0.35),
+                'x': x, 'y': -uniform(0.0, 1.5),
+                'vy': uniform(0.0, 0.35),
                 'volume_cells': packet_volume,
                 'life': 3.0,
             })
@@ -345,19 +395,26 @@ class FluidTankAnimation(AnimationBase):
         wave_speed = float(self.params.get('ripple_speed', 0.28)) * 42.0
         damping_frame = float(self.params.get('ripple_damping', 0.985))
         damping = damping_frame ** (sub_dt * 30.0)
+        acceleration = wave_speed * sub_dt
+        offset = self.surface_offset
+        velocity = self.surface_velocity
+        scratch = self._surface_laplacian
         for _ in range(steps):
-            left = np.empty_like(self.surface_offset)
-            right = np.empty_like(self.surface_offset)
-            left[1:] = self.surface_offset[:-1]
-            left[0] = self.surface_offset[1]
-            right[:-1] = self.surface_offset[1:]
-            right[-1] = self.surface_offset[-2]
-            laplacian = left + right - 2.0 * self.surface_offset
-            self.surface_velocity += laplacian * wave_speed * sub_dt
-            self.surface_velocity *= damping
-            self.surface_offset += self.surface_velocity * sub_dt
-            self.surface_offset -= float(np.mean(self.surface_offset))
-            np.clip(self.surface_offset, -3.5, 3.5, out=self.surface_offset)
+            # Reflecting walls: the missing neighbour mirrors the inner one.
+            np.add(offset[:-2], offset[2:], out=scratch[1:-1])
+            scratch[1:-1] -= offset[1:-1]
+            scratch[1:-1] -= offset[1:-1]
+            scratch[0] = 2.0 * (offset[1] - offset[0])
+            scratch[-1] = 2.0 * (offset[-2] - offset[-1])
+            scratch *= acceleration
+            velocity += scratch
+            velocity *= damping
+            # Reuse the stencil buffer for the displacement so every pass
+            # updates the surface in place without NumPy temporaries.
+            np.multiply(velocity, sub_dt, out=scratch)
+            offset += scratch
+            offset -= offset.mean()
+            np.clip(offset, -3.5, 3.5, out=offset)
 
     def _surface_y_values(self) -> np.ndarray:
         mean_depth = self.volume_cells / max(1, self.width)
@@ -366,8 +423,11 @@ class FluidTankAnimation(AnimationBase):
 
     def _coverage_and_surface(self) -> Tuple[np.ndarray, np.ndarray]:
         surface_y = self._surface_y_values()
-        coverage = np.clip(self._row_centers - surface_y[None, :] + 0.5, 0.0, 1.0)
-        return coverage.astype(np.float32), surface_y
+        coverage = self._coverage
+        np.subtract(self._row_centers, surface_y[None, :], out=coverage)
+        coverage += 0.5
+        np.clip(coverage, 0.0, 1.0, out=coverage)
+        return coverage, surface_y
 
     def _surface_at(self, x: float, values: Optional[np.ndarray] = None) -> float:
         if values is None:
@@ -382,22 +442,37 @@ class FluidTankAnimation(AnimationBase):
 
     def _impulse(self, x: float, strength: float):
         center = int(round(x))
+        velocity = self.surface_velocity
+        if 2 <= center < self.width - 2:
+            # Interior impulses, the common case, skip the per-tap bounds checks.
+            velocity[center] += strength
+            near = strength * 0.45
+            velocity[center - 1] += near
+            velocity[center + 1] += near
+            far = strength * 0.15
+            velocity[center - 2] += far
+            velocity[center + 2] += far
+            return
         for dx, falloff in ((0, 1.0), (-1, 0.45), (1, 0.45), (-2, 0.15), (2, 0.15)):
             nx = center + dx
             if 0 <= nx < self.width:
-                self.surface_velocity[nx] += strength * falloff
+                velocity[nx] += strength * falloff
 
     def _update_inlet_particles(self, dt: float, now: float):
-        active: List[Dict[str, float]] = []
+        particles = self.inlet_particles
+        kept = 0
         surface_values = self._surface_y_values()
         cell_height_m = max(0.005, float(self.params.get('cell_height_mm', 17.1)) / 1000.0)
         gravity_cells_s2 = 9.80665 / cell_height_m
         terminal_cells_s = max(2.0, float(self.params.get('drop_terminal_velocity_m_s', 9.0))) / cell_height_m
-        for p in self.inlet_particles:
-            local_dt = dt * self._slow_zone_factor(p['x'], p['y'], dt)
+        # Plant modifier state cannot change mid-frame; resolve it once.
+        slow_zone = self.plant_modifier_enabled('slow_zone')
+        obstacle = self._obstacle_enabled()
+        for p in particles:
+            local_dt = dt * self._slow_zone_factor(p['x'], p['y'], dt) if slow_zone else dt
             p['vy'] = min(terminal_cells_s, p['vy'] + gravity_cells_s2 * local_dt)
             p['y'] += p['vy'] * local_dt
-            if self._obstacle_enabled():
+            if obstacle:
                 p['x'] = self._nearest_clear_x(p['x'], p['y'])
             p['life'] -= dt
             surface = self._surface_at(p['x'], surface_values)
@@ -412,50 +487,59 @@ class FluidTankAnimation(AnimationBase):
                 self._impulse(p['x'], momentum)
                 continue
             if p['life'] > 0.0 and p['y'] < self.height:
-                active.append(p)
-        self.inlet_particles = active
+                # Survivors are compacted to the front of the list in place.
+                particles[kept] = p
+                kept += 1
+        del particles[kept:]
 
     def _update_bubbles(self, dt: float, now: float):
         if self._fill_ratio() > 0.08:
             self.bubble_accumulator += dt
         interval = max(0.3, float(self.params.get('bubble_interval', 2.4)))
+        slow_zone = self.plant_modifier_enabled('slow_zone')
+        obstacle = self._obstacle_enabled()
+        uniform = random.uniform
         while self.bubble_accumulator >= interval:
             self.bubble_accumulator -= interval
-            x = random.uniform(1.0, max(1.0, self.width - 2.0))
-            if self._obstacle_enabled():
+            x = uniform(1.0, max(1.0, self.width - 2.0))
+            if obstacle:
                 x = self._nearest_clear_x(x, self.height - 1.0)
-            radius = random.uniform(0.55, 1.35)
+            radius = uniform(0.55, 1.35)
             self.bubbles.append({
                 'x': x, 'origin_y': self.height - 0.5, 'y': self.height - 0.5,
-                'radius': radius, 'vy': -random.uniform(5.0, 8.0),
-                'phase': random.uniform(0.0, math.tau), 'age': 0.0,
+                'radius': radius, 'vy': -uniform(5.0, 8.0),
+                'phase': uniform(0.0, math.tau), 'age': 0.0,
             })
 
-        active: List[Dict[str, float]] = []
+        bubbles = self.bubbles
+        kept = 0
         surface_values = self._surface_y_values()
-        for bubble in self.bubbles:
-            local_dt = dt * self._slow_zone_factor(bubble['x'], bubble['y'], dt)
+        sin = math.sin
+        max_x = self.width - 1.5
+        bubble_strength = float(self.params.get('bubble_strength', 1.2))
+        for bubble in bubbles:
+            local_dt = dt * self._slow_zone_factor(bubble['x'], bubble['y'], dt) if slow_zone else dt
             bubble['age'] += local_dt
             bubble['phase'] += local_dt * (3.0 + bubble['radius'])
-            bubble['x'] += math.sin(bubble['phase']) * 0.45 * local_dt
-            bubble['x'] = max(0.5, min(self.width - 1.5, bubble['x']))
+            bubble['x'] += sin(bubble['phase']) * 0.45 * local_dt
+            bubble['x'] = max(0.5, min(max_x, bubble['x']))
             bubble['y'] += bubble['vy'] * local_dt
-            if self._obstacle_enabled():
+            if obstacle:
                 routed_x = self._nearest_clear_x(bubble['x'], bubble['y'])
                 if routed_x != bubble['x']:
                     bubble['phase'] += math.pi
-                    bubble['x'] = max(0.5, min(self.width - 1.5, routed_x))
+                    bubble['x'] = max(0.5, min(max_x, routed_x))
             bubble['radius'] = min(1.8, bubble['radius'] + 0.018 * local_dt)
             surface = self._surface_at(bubble['x'], surface_values)
             rise = bubble['origin_y'] - bubble['y']
             self.max_bubble_rise = max(self.max_bubble_rise, rise)
             if bubble['y'] - bubble['radius'] <= surface:
-                strength = float(self.params.get('bubble_strength', 1.2)) * bubble['radius']
-                self._impulse(bubble['x'], -strength)
+                self._impulse(bubble['x'], -(bubble_strength * bubble['radius']))
                 continue
             if bubble['y'] < self.height and surface < self.height:
-                active.append(bubble)
-        self.bubbles = active
+                bubbles[kept] = bubble
+                kept += 1
+        del bubbles[kept:]
 
     def _maybe_auto_hole(self, now: float):
         if not bool(self.params.get('auto_hole', True)) or self.holes or self.patch_flashes:
@@ -534,33 +618,45 @@ class FluidTankAnimation(AnimationBase):
 
     def _spawn_spray(self, hole: Hole, amount: float, head: float):
         expected = min(4, int(amount) + (1 if random.random() < amount % 1.0 else 0))
+        uniform = random.uniform
         for _ in range(expected):
-            if len(self.spray_particles) >= 80:
+            index = self.spray_count
+            if index >= self.MAX_SPRAY_PARTICLES:
                 break
             speed = min(24.0, 5.0 + math.sqrt(head) * 1.8)
-            self.spray_particles.append({
-                'x': hole.x + random.uniform(-0.35, 0.35),
-                'y': hole.y + random.uniform(-0.3, 0.3),
-                'vx': random.uniform(-1.8, 1.8),
-                'vy': -random.uniform(speed * 0.45, speed),
-                'life': random.uniform(0.35, 0.8),
-            })
+            self._spray[:, index] = (
+                hole.x + uniform(-0.35, 0.35),
+                hole.y + uniform(-0.3, 0.3),
+                uniform(-1.8, 1.8),
+                -uniform(speed * 0.45, speed),
+                uniform(0.35, 0.8),
+            )
+            self.spray_count = index + 1
 
     def _update_spray(self, dt: float):
-        active: List[Dict[str, float]] = []
-        for p in self.spray_particles:
-            p['vy'] += 12.0 * dt
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            p['life'] -= dt
-            if p['life'] > 0.0 and -2.0 <= p['y'] < self.height + 2.0:
-                active.append(p)
-        self.spray_particles = active
+        count = self.spray_count
+        if count == 0:
+            return
+        x, y, vx, vy, life = self._spray[:, :count]
+        vy += 12.0 * dt
+        x += vx * dt
+        y += vy * dt
+        life -= dt
+        alive = (life > 0.0) & (y >= -2.0) & (y < self.height + 2.0)
+        survivors = np.flatnonzero(alive)
+        if len(survivors) < count:
+            self._spray[:, :len(survivors)] = self._spray[:, survivors]
+            self.spray_count = len(survivors)
 
     def _update_patch_flashes(self, dt: float):
-        for flash in self.patch_flashes:
+        flashes = self.patch_flashes
+        kept = 0
+        for flash in flashes:
             flash['life'] -= dt
-        self.patch_flashes = [flash for flash in self.patch_flashes if flash['life'] > 0.0]
+            if flash['life'] > 0.0:
+                flashes[kept] = flash
+                kept += 1
+        del flashes[kept:]
 
     def _maybe_reset_cycle(self, now: float):
         if self.awaiting_cycle_reset and not self.holes and not self.patch_flashes and self._fill_ratio() <= 0.01:
@@ -576,21 +672,30 @@ class FluidTankAnimation(AnimationBase):
         if self._water_grid_cache_time < 0.0 or now - self._water_grid_cache_time >= 1.0 / 60.0:
             self._water_grid_cache = self._render_water_base(now, coverage, surface_y)
             self._water_grid_cache_time = now
-        grid = self._water_grid_cache.copy()
+        grid = self._frame_grid
+        np.copyto(grid, self._water_grid_cache)
 
-        # Rim-lit bubbles: dark core, bright upper rim.
+        # Rim-lit bubbles: dark core, bright upper rim. Only the rim's bounding
+        # box can change, so each bubble touches a few cells, not the canvas.
+        rim_color = np.array([174.0, 232.0, 255.0], dtype=np.float32)
         for bubble in self.bubbles:
-            dx = xx - bubble['x']
-            dy = yy - bubble['y']
+            bx, by, radius = bubble['x'], bubble['y'], bubble['radius']
+            rim_r = radius * 1.15
+            bounds = self._overlay_bounds(bx, by, rim_r)
+            if bounds is None:
+                continue
+            rows, cols = bounds
+            dx = xx[:, cols] - bx
+            dy = yy[rows] - by
             dist2 = dx * dx + dy * dy
-            core_r = bubble['radius'] * 0.58
-            rim_r = bubble['radius'] * 1.15
-            core = dist2 < core_r * core_r
-            rim = (dist2 >= core_r * core_r) & (dist2 <= rim_r * rim_r)
-            grid[core] *= 0.28
-            upper_rim = rim * np.clip(0.75 - dy / max(0.3, bubble['radius']), 0.15, 1.0)
-            t = upper_rim[:, :, None]
-            grid = grid * (1.0 - t * 0.72) + np.array([174.0, 232.0, 255.0]) * t * 0.72
+            core_r2 = (radius * 0.58) ** 2
+            box = grid[rows, cols]
+            box[dist2 < core_r2] *= 0.28
+            rim = (dist2 >= core_r2) & (dist2 <= rim_r * rim_r)
+            upper_rim = rim * np.clip(0.75 - dy / max(0.3, radius), 0.15, 1.0)
+            t = upper_rim[:, :, None] * 0.72
+            box *= 1.0 - t
+            box += rim_color * t
 
         # Inlet streaks and spray are deliberately brighter than the body.
         for p in self.inlet_particles:
@@ -599,38 +704,72 @@ class FluidTankAnimation(AnimationBase):
             # A short exposure trail prevents high-speed droplets from strobing
             # between diffuser cells at 150-200 Hz.
             trail_length = max(1, min(8, int(math.ceil(p['vy'] / 150.0))))
-            for tail in range(trail_length):
-                py = y0 - tail
-                if 0 <= px < width and 0 <= py < height:
-                    alpha = 1.0 - tail / max(1.0, trail_length + 0.5)
-                    # Direct assignment avoids dozens of tiny temporary NumPy
-                    # arrays per frame on the Raspberry Pi.
-                    grid[py, px] = (170.0 * alpha, 220.0 * alpha, 255.0 * alpha)
-        for p in self.spray_particles:
-            px, py = int(round(p['x'])), int(round(p['y']))
-            if 0 <= px < width and 0 <= py < height:
-                alpha = min(1.0, p['life'] * 2.0)
-                grid[py, px] = (205.0 * alpha, 240.0 * alpha, 255.0 * alpha)
+            if not 0 <= px < width:
+                continue
+            # Clip the trail to the visible rows once instead of testing
+            # every tail cell against the canvas edges.
+            first_tail = max(0, y0 - height + 1)
+            last_tail = min(trail_length, y0 + 1)
+            for tail in range(first_tail, last_tail):
+                alpha = 1.0 - tail / max(1.0, trail_length + 0.5)
+                # Direct assignment avoids dozens of tiny temporary NumPy
+                # arrays per frame on the Raspberry Pi.
+                grid[y0 - tail, px] = (170.0 * alpha, 220.0 * alpha, 255.0 * alpha)
+        if self.spray_count:
+            x, y, _vx, _vy, life = self._spray[:, :self.spray_count]
+            px = np.rint(x).astype(np.intp)
+            py = np.rint(y).astype(np.intp)
+            visible = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            alpha = np.minimum(1.0, life[visible] * 2.0)[:, None]
+            grid[py[visible], px[visible]] = np.array([205.0, 240.0, 255.0]) * alpha
 
         # A puncture reads as a black aperture with a turbulent bright rim.
+        # Holes and flashes, like bubbles, only touch their bounding boxes.
+        hole_rim_color = np.array([135.0, 218.0, 255.0], dtype=np.float32)
         for hole in self.holes:
-            dist = np.sqrt((xx - hole.x) ** 2 + (yy - hole.y) ** 2)
+            bounds = self._overlay_bounds(hole.x, hole.y, hole.radius * 1.28)
+            if bounds is None:
+                continue
+            rows, cols = bounds
+            dist = np.sqrt((xx[:, cols] - hole.x) ** 2 + (yy[rows] - hole.y) ** 2)
+            box = grid[rows, cols]
             core = dist <= hole.radius * 0.62
             rim = (dist > hole.radius * 0.62) & (dist <= hole.radius * 1.28)
-            grid[core] = np.array([0.0, 1.0, 2.0])
+            box[core] = (0.0, 1.0, 2.0)
             flicker = 0.72 + 0.28 * math.sin(now * 17.0 + hole.x)
             rim_alpha = np.clip(1.0 - np.abs(dist - hole.radius) / max(0.3, hole.radius * 0.55), 0.0, 1.0) * rim * flicker
-            grid = grid * (1.0 - rim_alpha[:, :, None]) + np.array([135.0, 218.0, 255.0]) * rim_alpha[:, :, None]
+            rim_alpha = rim_alpha[:, :, None]
+            box *= 1.0 - rim_alpha
+            box += hole_rim_color * rim_alpha
+        flash_color = np.array([150.0, 225.0, 255.0], dtype=np.float32)
         for flash in self.patch_flashes:
-            dist = np.sqrt((xx - flash['x']) ** 2 + (yy - flash['y']) ** 2)
-            alpha = np.clip(1.0 - dist / (flash['radius'] * 1.5), 0.0, 1.0) * (flash['life'] / max(0.001, flash['max_life']))
-            grid = grid * (1.0 - alpha[:, :, None]) + np.array([150.0, 225.0, 255.0]) * alpha[:, :, None]
+            reach = flash['radius'] * 1.5
+            bounds = self._overlay_bounds(flash['x'], flash['y'], reach)
+            if bounds is None:
+                continue
+            rows, cols = bounds
+            dist = np.sqrt((xx[:, cols] - flash['x']) ** 2 + (yy[rows] - flash['y']) ** 2)
+            alpha = np.clip(1.0 - dist / reach, 0.0, 1.0) * (flash['life'] / max(0.001, flash['max_life']))
+            alpha = alpha[:, :, None]
+            box = grid[rows, cols]
+            box *= 1.0 - alpha
+            box += flash_color * alpha
 
         if self.plant_modifier_enabled('refract'):
             grid = self._apply_plant_refraction(grid)
 
         np.clip(grid, 0, 255, out=grid)
-        return self._map_grid_to_pixels(grid.astype(np.uint8))
+        return self._map_grid_to_pixels(grid)
+
+    def _overlay_bounds(self, x: float, y: float, reach: float) -> Optional[Tuple[slice, slice]]:
+        """Return the canvas row/column slices within ``reach`` of a point."""
+        row0 = max(0, int(math.floor(y - reach)))
+        row1 = min(self.height, int(math.ceil(y + reach)) + 1)
+        col0 = max(0, int(math.floor(x - reach)))
+        col1 = min(self.width, int(math.ceil(x + reach)) + 1)
+        if row0 >= row1 or col0 >= col1:
+            return None
+        return slice(row0, row1), slice(col0, col1)
 
     def _apply_plant_refraction(self, grid: np.ndarray) -> np.ndarray:
         """Presentation-only displacement around calibrated geometry."""
@@ -653,66 +792,109 @@ class FluidTankAnimation(AnimationBase):
                            surface_y: np.ndarray) -> np.ndarray:
         """Render the slower water body at 60 Hz; particles remain full-rate."""
         yy, xx = self._yy, self._xx
-        depth = np.maximum(0.0, yy + 0.5 - surface_y[None, :])
-        depth_t = np.clip(depth / max(8.0, self.height * 0.72), 0.0, 1.0)
+        depth = self._depth
+        np.add(yy, 0.5, out=depth)
+        depth -= surface_y[None, :]
+        np.maximum(depth, 0.0, out=depth)
+        depth_t = self._depth_t
+        np.divide(depth, max(8.0, self.height * 0.72), out=depth_t)
+        np.clip(depth_t, 0.0, 1.0, out=depth_t)
 
         air = np.array([1.0, 2.0, 4.0], dtype=np.float32)
         surface_color = np.array([52.0, 145.0, 238.0], dtype=np.float32)
         deep_color = np.array([3.0, 31.0, 67.0], dtype=np.float32)
-        water_color = surface_color[None, None, :] * (1.0 - depth_t[:, :, None]) + deep_color[None, None, :] * depth_t[:, :, None]
+        # The body colour is built in the cached frame buffer itself: a lerp
+        # written as surface + (deep - surface) * t, then lighting terms added
+        # in place, so the 60 Hz pass does not allocate full RGB temporaries.
+        grid = self._water_grid_cache
+        np.multiply(depth_t[:, :, None], deep_color - surface_color, out=grid)
+        grid += surface_color
 
         caustic_strength = float(self.params.get('caustic_strength', 0.18))
         # Caustics move slowly, so recomputing transcendental functions at LED
         # refresh rate wastes most of the Pi's frame budget. A 30 Hz lighting
         # field remains visually continuous while droplets/surface run at 200 Hz.
         if self._caustic_cache_time < 0.0 or now - self._caustic_cache_time >= 1.0 / 30.0:
-            self._caustic_cache = (
-                np.sin(xx * 0.47 + yy * 0.09 - now * 1.3)
-                + np.sin(xx * 0.19 - yy * 0.13 + now * 0.77)
-            ) * 0.5
+            cache = self._caustic_cache
+            light = self._light_plane
+            np.multiply(xx, 0.47, out=cache)
+            cache += yy * 0.09 - now * 1.3
+            np.sin(cache, out=cache)
+            np.multiply(xx, 0.19, out=light)
+            light -= yy * 0.13 - now * 0.77
+            np.sin(light, out=light)
+            cache += light
+            cache *= 0.5
             self._caustic_cache_time = now
-        caustic = self._caustic_cache * caustic_strength * np.clip(1.0 - depth / 72.0, 0.0, 1.0)
-        water_color *= (1.0 + caustic[:, :, None])
-
-        surface_band = np.clip(1.0 - np.abs(depth - 0.55) / 1.25, 0.0, 1.0)
+        # One scratch plane carries each lighting term in turn: caustic gain,
+        # then the meniscus edge light.
+        light = self._light_plane
+        np.multiply(depth, -1.0 / 72.0, out=light)
+        light += 1.0
+        np.clip(light, 0.0, 1.0, out=light)
+        light *= self._caustic_cache
+        light *= caustic_strength
+        light += 1.0
+        grid *= light[:, :, None]
+
+        surface_band = self._surface_band
+        np.subtract(depth, 0.55, out=surface_band)
+        np.abs(surface_band, out=surface_band)
+        surface_band *= -1.0 / 1.25
+        surface_band += 1.0
+        np.clip(surface_band, 0.0, 1.0, out=surface_band)
         shimmer = float(self.params.get('surface_shimmer', 0.35))
-        water_color += surface_band[:, :, None] * np.array([45.0, 62.0, 72.0]) * shimmer
+        grid += surface_band[:, :, None] * (np.array([45.0, 62.0, 72.0], dtype=np.float32) * shimmer)
 
-        meniscus = self._edge_light * np.clip(1.0 - depth / 3.5, 0.0, 1.0)
-        water_color += meniscus[:, :, None] * np.array([38.0, 58.0, 72.0])
+        np.multiply(depth, -1.0 / 3.5, out=light)
+        light += 1.0
+        np.clip(light, 0.0, 1.0, out=light)
+        light *= self._edge_light
+        grid += light[:, :, None] * np.array([38.0, 58.0, 72.0], dtype=np.float32)
 
-        grid = air[None, None, :] * (1.0 - coverage[:, :, None]) + water_color * coverage[:, :, None]
+        grid -= air
+        grid *= coverage[:, :, None]
+        grid += air
 
         if self._obstacle_enabled():
             # Foliage is porous submerged structure: it absorbs some blue body
             # light but catches moving green caustics. Rooting globes read as
             # solid warm glass landmarks. Simulation landmarks are rendered
             # afterward, so bubbles, drops, holes, and spray remain legible.
-            foliage = self._plant_foliage
-            if np.any(foliage):
+            # Both blends gather only the plant pixels and work on their
+            # caustic samples, rather than building full-frame colour planes.
+            if self._plant_foliage_pixels:
+                foliage = self._plant_foliage
                 foliage_light = np.clip(
-                    0.55 + 0.45 * self._caustic_cache, 0.15, 1.0
-                )[:, :, None]
-                foliage_color = np.array([5.0, 84.0, 38.0]) * foliage_light
-                grid[foliage] = grid[foliage] * 0.38 + foliage_color[foliage] * 0.62
-            globes = self._plant_globes
-            if np.any(globes):
-                globe_color = np.empty_like(grid)
-                globe_color[:, :, 0] = 118.0 + 34.0 * np.clip(self._caustic_cache, -1.0, 1.0)
-                globe_color[:, :, 1] = 82.0 + 18.0 * np.clip(self._caustic_cache, -1.0, 1.0)
-                globe_color[:, :, 2] = 38.0
-                grid[globes] = grid[globes] * 0.22 + globe_color[globes] * 0.78
+                    0.55 + 0.45 * self._caustic_cache[foliage], 0.15, 1.0
+                )[:, None]
+                grid[foliage] = (
+                    grid[foliage] * 0.38
+                    + foliage_light * (np.array([5.0, 84.0, 38.0], dtype=np.float32) * 0.62)
+                )
+            if self._plant_globe_pixels:
+                globes = self._plant_globes
+                glint = np.clip(self._caustic_cache[globes], -1.0, 1.0)[:, None]
+                globe_color = (
+                    np.array([118.0, 82.0, 38.0], dtype=np.float32)
+                    + glint * np.array([34.0, 18.0, 0.0], dtype=np.float32)
+                )
+                grid[globes] = grid[globes] * 0.22 + globe_color * 0.78
 
         if self.plant_modifier_enabled('slow_zone'):
             radius = max(2.0, float(self.params.get('plant_clearance', 1)) + 3.0)
-            halo = np.clip(1.0 - self._plant_distance / radius, 0.0, 1.0)
+            halo = self._light_plane
+            np.multiply(self._plant_distance, -1.0 / radius, out=halo)
+            halo += 1.0
+            np.clip(halo, 0.0, 1.0, out=halo)
             halo *= 0.18 * self.plant_modifier_strength('slow_zone')
-            grid = grid * (1.0 - halo[:, :, None]) + np.array([40.0, 72.0, 108.0]) * halo[:, :, None]
+            # grid * (1 - halo) + tint * halo, as a single lerp toward the tint.
+            grid += (np.array([40.0, 72.0, 108.0], dtype=np.float32) - grid) * halo[:, :, None]
 
         wave_energy = np.abs(self.surface_velocity)[None, :]
         foam = (surface_band > 0.42) & (wave_energy > (1.4 - float(self.params.get('foam_bias', 0.25)))) & (coverage > 0.05)
         if np.any(foam):
-            grid[foam] = grid[foam] * 0.25 + np.array([190.0, 225.0, 245.0]) * 0.75
+            grid[foam] = grid[foam] * 0.25 + np.array([190.0, 225.0, 245.0], dtype=np.float32) * 0.75
         return grid
 
     def _map_grid_to_pixels(self, grid: np.ndarray) -> np.ndarray:
@@ -722,6 +904,8 @@ class FluidTankAnimation(AnimationBase):
             else self._normal_flat_idx
         )
         pixels = self.next_frame_buffer(clear=True)
+        # The scatter into the uint8 frame performs the float -> uint8 cast,
+        # so the clipped grid needs no intermediate astype copy.
         pixels[flat_idx] = grid.reshape(-1, 3)
         return self.apply_brightness_array(pixels, out=pixels)
 
@@ -732,13 +916,14 @@ class FluidTankAnimation(AnimationBase):
             {'x': round(h.x, 2), 'y': round(h.y, 2), 'radius': round(h.radius, 2), 'head': round(max(0.0, h.y - (self.height - self.volume_cells / max(1, self.width))), 2), 'manual': h.manual}
             for h in self.holes[:8]
         ]
+        airborne = sum(p['volume_cells'] for p in self.inlet_particles)
         self.last_stats = {
             'time': now, 'dt_real': dt,
             'width': self.width, 'height': self.height, 'total_cells': int(self.capacity_cells),
             'cc_per_cell': self.CC_PER_CELL, 'capacity_cc': self.capacity_cells * self.CC_PER_CELL,
             'volume_cells': self.volume_cells, 'volume_cc': self.volume_cells * self.CC_PER_CELL,
-            'airborne_volume_cells': sum(p['volume_cells'] for p in self.inlet_particles),
-            'airborne_volume_cc': sum(p['volume_cells'] for p in self.inlet_particles) * self.CC_PER_CELL,
+            'airborne_volume_cells': airborne,
+            'airborne_volume_cc': airborne * self.CC_PER_CELL,
             'queued_inlet_volume_cells': self.inlet_reservoir_cells,
             'fill_ratio': self._fill_ratio(), 'expected_ratio': expected,
             'spawn_allowed': not self.holes and not self.awaiting_cycle_reset,
@@ -748,7 +933,7 @@ class FluidTankAnimation(AnimationBase):
             'hole_cooldown_timer': self.hole_cooldown_timer,
             'hole_water_remaining': int(self.volume_cells) if self.holes else 0,
             'bubble_count': len(self.bubbles), 'max_bubble_rise': self.max_bubble_rise,
-            'spray_particle_count': len(self.spray_particles), 'last_spray_time': self.last_spray_time,
+            'spray_particle_count': self.spray_count, 'last_spray_time': self.last_spray_time,
             'last_manual_hole_time': self.last_manual_hole_time,
             'drop_glow_count': len(self.inlet_particles),
             'surface_min_y': float(np.min(surface_y)), 'surface_max_y': float(np.max(surface_y)),
@@ -765,8 +950,8 @@ class FluidTankAnimation(AnimationBase):
             self.last_stats.update({
                 'plant_aware': True,
                 'plant_active_modifiers': list(self.plant_modifier_state().active),
-                'plant_foliage_pixels': int(np.count_nonzero(self._plant_foliage)),
-                'plant_globe_pixels': int(np.count_nonzero(self._plant_globes)),
+                'plant_foliage_pixels': self._plant_foliage_pixels,
+                'plant_globe_pixels': self._plant_globe_pixels,
                 'plant_flow_deflections': self._plant_flow_deflections,
                 'plant_slow_zone_steps': self._plant_slow_zone_steps,
                 'plant_slow_zone_seconds': self._plant_slow_zone_seconds,
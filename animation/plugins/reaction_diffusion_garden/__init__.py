@@ -22,6 +22,8 @@ class ReactionDiffusionGardenAnimation(ProceduralLivingBase):
                                     "edge_glow":.65, "color_by_age":.6, "perturbation_interval":24.0})
         self.params = {**self.default_params, **self.config}
         self.rng = np.random.default_rng(int(self.params["seed"]))
+        self._step_key = None
+        self._step_values = ()
         self._initialize_simulation()
 
     def get_parameter_schema(self):
@@ -47,6 +49,12 @@ class ReactionDiffusionGardenAnimation(ProceduralLivingBase):
         self.u = np.ones((self.height, self.width), dtype=np.float32)
         self.v = np.zeros_like(self.u)
         self.age = np.zeros_like(self.u)
+        # Fixed-shape work buffers: the next-state grids swap with u/v each step.
+        self._u_next = np.empty_like(self.u)
+        self._v_next = np.empty_like(self.u)
+        self._lap_halo = np.empty((self.height + 2, self.width + 2), dtype=np.float32)
+        self._lap_corners = np.empty_like(self.u)
+        self._edge_lap = np.empty_like(self.u)
         count = max(3, min(48, int(12 * float(np.clip(self.params.get("density", 1), .2, 2)))))
         mode = self.params.get("seeding_mode", "scattered")
         if mode == "center":
@@ -62,14 +70,39 @@ class ReactionDiffusionGardenAnimation(ProceduralLivingBase):
         self.u[ys, xs] = .2
         self._next_perturbation = float(self.params.get("perturbation_interval", 24.0))
 
-    @staticmethod
-    def _lap(field):
-        return (-field + .2 * (np.roll(field,1,0)+np.roll(field,-1,0)+np.roll(field,1,1)+np.roll(field,-1,1))
-                + .05 * (np.roll(np.roll(field,1,0),1,1)+np.roll(np.roll(field,1,0),-1,1)
-                           +np.roll(np.roll(field,-1,0),1,1)+np.roll(np.roll(field,-1,0),-1,1)))
+    def _lap(self, field, out):
+        """Wrapped 9-point Laplacian of ``field`` written into ``out``.
+
+        The halo and corner buffers are sized once per grid shape, so every
+        step reads shifted views of one padded copy instead of np.roll copies.
+        """
+        halo, corners = self._lap_halo, self._lap_corners
+        halo[1:-1, 1:-1] = field
+        halo[0, 1:-1] = field[-1]; halo[-1, 1:-1] = field[0]
+        halo[:, 0] = halo[:, -2]; halo[:, -1] = halo[:, 1]
+        np.add(halo[:-2, 1:-1], halo[2:, 1:-1], out=out)
+        out += halo[1:-1, :-2]; out += halo[1:-1, 2:]
+        out *= .2
+        np.add(halo[:-2, :-2], halo[:-2, 2:], out=corners)
+        corners += halo[2:, :-2]; corners += halo[2:, 2:]
+        corners *= .05
+        out += corners
+        out -= field
+        return out
+
+    def _step_constants(self, dt):
+        """Scalars for a fixed-rate step, recomputed only when their inputs change."""
+        morphology = self.params.get("morphology", "coral")
+        growth = self.params.get("growth_rate", 1)
+        key = (dt, morphology, growth)
+        if key != self._step_key:
+            f, k = self.REGIMES.get(morphology, self.REGIMES["coral"])
+            rate = float(np.clip(growth, .25, 2)) * dt * 10.0
+            self._step_key, self._step_values = key, (f, k, rate)
+        return self._step_values
 
     def _simulate_step(self, dt):
-        f, k = self.REGIMES.get(self.params.get("morphology", "coral"), self.REGIMES["coral"])
+        f, k, rate = self._step_constants(dt)
         habitat = self.plant_modifier_strength("habitat")
         obstacle = self.plant_modifier_strength("obstacle")
         hazard = self.plant_modifier_strength("hazard")
@@ -78,16 +111,28 @@ class ReactionDiffusionGardenAnimation(ProceduralLivingBase):
         if habitat > 0:
             feed = f + masks.foliage.T.astype(np.float32) * (.008 * habitat)
         uvv = self.u * self.v * self.v
-        rate = float(np.clip(self.params.get("growth_rate", 1), .25, 2)) * dt * 10.0
-        nu = self.u + (1.0 * self._lap(self.u) - uvv + feed * (1-self.u)) * rate
-        nv = self.v + (.5 * self._lap(self.v) + uvv - (feed+k)*self.v) * rate
+        # u' = u + (Du*lap(u) - uvv + F*(1-u)) * rate with Du = 1, and
+        # v' = v + (Dv*lap(v) + uvv - (F+k)*v) * rate with Dv = .5, each
+        # accumulated in place in its Laplacian buffer.
+        nu = self._lap(self.u, self._u_next)
+        nu -= uvv
+        nu += feed * (1-self.u)
+        nu *= rate
+        nu += self.u
+        nv = self._lap(self.v, self._v_next)
+        nv *= .5
+        nv += uvv
+        nv -= (feed+k) * self.v
+        nv *= rate
+        nv += self.v
         np.clip(nu, 0, 1, out=nu); np.clip(nv, 0, 1, out=nv)
         if obstacle > 0:
             core = masks.obstacle.T
             nu[core] = self.u[core]; nv[core] = self.v[core]
         if hazard > 0:
             nv[masks.obstacle.T] *= max(0.0, 1.0 - .8 * hazard)
-        self.u, self.v = nu, nv
+        self.u, self._u_next = nu, self.u
+        self.v, self._v_next = nv, self.v
         self.age += (self.v > .18).astype(np.float32) * dt
         emitter = self.plant_modifier_strength("emitter")
         interval = float(self.params.get("perturbation_interval", 24.0))
@@ -105,7 +150,7 @@ class ReactionDiffusionGardenAnimation(ProceduralLivingBase):
 
     def _render_scene(self, elapsed):
         dark, mid, light = (np.asarray(c, dtype=np.float32) for c in self._palette())
-        edge = np.clip(np.abs(self._lap(self.v)) * 5.0, 0, 1)
+        edge = np.clip(np.abs(self._lap(self.v, self._edge_lap)) * 5.0, 0, 1)
         body = np.clip(self.v * 1.4, 0, 1)
         history = np.clip(self.age / 25.0, 0, 1) * float(self.params.get("color_by_age", .6))
         canvas = dark + body[...,None] * (mid-dark) + (edge * float(self.params.get("edge_glow",.65)))[...,None] * (light-mid)
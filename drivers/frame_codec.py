@@ -6,16 +6,26 @@ The goal is to keep status.json smaller so it can be shared or snapshotted
 without megabytes of raw RGB tuples. The encoding packs the RGB list as a
 compact JSON string, compresses it with zlib, and base64-encodes the result so
 it remains JSON friendly.
+
+Live status frames use a leaner variant: the raw 8-bit RGB bytes are
+compressed directly, skipping the per-pixel JSON text. Decoders pick the
+variant from the payload's ``frame_encoding`` field.
 """
 
 from __future__ import annotations
 
 import base64
 import json
+import struct
 import zlib
-from typing import Any, List
+from typing import Any, List, Optional
+
+import numpy as np
 
 FRAME_ENCODING_NAME = "json-zlib-base64"
+RGB_FRAME_ENCODING_NAME = "rgb24-zlib-base64"
+FRAME_PACKET_MAGIC = b"LGRB"
+_FRAME_PACKET_HEADER = struct.Struct("<4sI")
 
 
 def encode_frame_data(frame_data: List[Any]) -> str:
@@ -37,12 +47,34 @@ def encode_frame_data(frame_data: List[Any]) -> str:
     return base64.b64encode(compressed).decode("ascii")
 
 
-def decode_frame_data(encoded: str) -> List[Any]:
+def encode_rgb_frame(frame_data: Any) -> str:
+    """
+    Compress a frame as packed 8-bit RGB bytes into a base64 string.
+
+    Args:
+        frame_data: ``(N, 3)`` uint8 array, or anything numpy can view as one.
+
+    Returns:
+        Base64 string in the RGB_FRAME_ENCODING_NAME format. Empty string when
+        there is nothing to encode.
+    """
+    pixels = np.ascontiguousarray(frame_data, dtype=np.uint8)
+    if pixels.size == 0:
+        return ""
+
+    compressed = zlib.compress(pixels.tobytes())
+    return base64.b64encode(compressed).decode("ascii")
+
+
+def decode_frame_data(encoded: str, encoding: Optional[str] = None) -> List[Any]:
     """
     Decode a compressed frame data string back into the list representation.
 
     Args:
-        encoded: Base64 string produced by encode_frame_data.
+        encoded: Base64 string produced by encode_frame_data or
+            encode_rgb_frame.
+        encoding: The payload's ``frame_encoding``; anything other than
+            RGB_FRAME_ENCODING_NAME is treated as the JSON variant.
 
     Returns:
         List of RGB tuples (lists).
@@ -52,8 +84,84 @@ def decode_frame_data(encoded: str) -> List[Any]:
 
     try:
         compressed = base64.b64decode(encoded)
-        unpacked = zlib.decompress(compressed).decode("utf-8")
-        return json.loads(unpacked)
+        unpacked = zlib.decompress(compressed)
+        if encoding == RGB_FRAME_ENCODING_NAME:
+            pixels = np.frombuffer(unpacked, dtype=np.uint8)
+            return pixels[: pixels.size - pixels.size % 3].reshape(-1, 3).tolist()
+        return json.loads(unpacked.decode("utf-8"))
     except Exception:
         # Bad payloads should not crash the UI; treat them as empty.
         return []
+
+
+def decode_frame_bytes(encoded: str, encoding: Optional[str] = None) -> bytes:
+    """
+    Decode a compressed frame data string into packed 8-bit RGB bytes.
+
+    Args:
+        encoded: Base64 string produced by encode_frame_data or
+            encode_rgb_frame.
+        encoding: The payload's ``frame_encoding``, as for decode_frame_data.
+
+    Returns:
+        ``3 * N`` bytes of RGB data; empty when the payload is empty or bad.
+    """
+    if not encoded:
+        return b""
+
+    if encoding == RGB_FRAME_ENCODING_NAME:
+        try:
+            unpacked = zlib.decompress(base64.b64decode(encoded))
+        except Exception:
+            return b""
+        return unpacked[: len(unpacked) - len(unpacked) % 3]
+
+    return rgb_frame_bytes(decode_frame_data(encoded, encoding))
+
+
+def decode_frame_array(encoded: str, encoding: Optional[str] = None) -> np.ndarray:
+    """
+    Decode a compressed frame data string into an ``(N, 3)`` uint8 array.
+
+    The array is a read-only view of the decoded bytes; it is empty (shape
+    ``(0, 3)``) when the payload is empty or bad.
+    """
+    return np.frombuffer(decode_frame_bytes(encoded, encoding), dtype=np.uint8).reshape(-1, 3)
+
+
+def rgb_frame_bytes(frame_data: Any) -> bytes:
+    """
+    Pack a frame (list of RGB tuples, or an ``(N, 3)`` array) into RGB bytes.
+
+    Returns:
+        ``3 * N`` bytes; empty when the frame is empty or not RGB shaped.
+    """
+    try:
+        pixels = np.asarray(frame_data, dtype=np.uint8)
+    except (TypeError, ValueError):
+        return b""
+    if pixels.ndim != 2 or pixels.shape[1] < 3:
+        return b""
+    return np.ascontiguousarray(pixels[:, :3]).tobytes()
+
+
+def pack_frame_packet(rgb: bytes) -> bytes:
+    """
+    Frame a packed RGB buffer for binary transports such as WebSockets.
+
+    The layout is FRAME_PACKET_MAGIC, the LED count as a little-endian
+    uint32, then ``3 * count`` raw RGB bytes.
+    """
+    count = len(rgb) // 3
+    return _FRAME_PACKET_HEADER.pack(FRAME_PACKET_MAGIC, count) + rgb[: count * 3]
+
+
+def unpack_frame_packet(packet: bytes) -> bytes:
+    """Return the RGB bytes of a pack_frame_packet packet (empty if malformed)."""
+    if len(packet) < _FRAME_PACKET_HEADER.size:
+        return b""
+    magic, count = _FRAME_PACKET_HEADER.unpack_from(packet)
+    rgb = packet[_FRAME_PACKET_HEADER.size:]
+    if magic != FRAME_PACKET_MAGIC or len(rgb) != count * 3:
+        return b""
+    return rgb
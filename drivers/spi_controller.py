@@ -9,7 +9,9 @@ import colorsys
 import argparse
 import binascii
 import spidev
+import struct
 import sys
+import traceback
 
 import numpy as np
 
@@ -28,12 +30,18 @@ SPI_INTER_FRAME_DELAY = 0.0  # No delay needed - SPI is stable now
 
 MAX_SPI_TRANSFER = 4096
 CRC_BYTES = 2
+RANGE_HEADER = struct.Struct('>BHB')  # command, start pixel, pixel count
+CRC_FIELD = struct.Struct('>H')
 RECEIVER_STATUS_MAGIC = (ord('L'), ord('G'), ord('S'), ord('1'))
 RECEIVER_STATUS_MAGIC_V2 = (ord('L'), ord('G'), ord('S'), ord('2'))
 RECEIVER_STATUS_BYTES = 29
 RECEIVER_STATUS_BYTES_V2 = 64
 MAX_PIXELS_SET_ALL = (MAX_SPI_TRANSFER - 1 - CRC_BYTES) // 3
 MAX_PIXELS_PER_RANGE = min(255, (MAX_SPI_TRANSFER - 4 - CRC_BYTES) // 3)
+# Dirty ranges separated by at most this many clean pixels are sent as one
+# SET_RANGE. Resending a short gap costs less than another chip-select cycle
+# plus header and CRC.
+RANGE_MERGE_GAP_PIXELS = 16
 
 GLOBAL_OPTS_WITH_VALUE = {"--bus", "--device", "--spi-speed", "--mode", "--brightness", "--strips", "--leds-per-strip"}
 GLOBAL_BOOL_OPTS = {"--debug"}
@@ -97,6 +105,34 @@ CMD_CONFIG = 0x07
 CMD_PING = 0xFF
 
 
+def _control_packet(command):
+    """Return a complete single-byte command packet, CRC included."""
+    crc = _crc16_ccitt(bytes([command]))
+    return bytes([command, (crc >> 8) & 0xFF, crc & 0xFF])
+
+
+# Argument-free commands never change, so their packets are built once.
+SHOW_PACKET = _control_packet(CMD_SHOW)
+CLEAR_PACKET = _control_packet(CMD_CLEAR)
+PING_PACKET = _control_packet(CMD_PING)
+
+
+def _coalesce_ranges(ranges, total_leds, gap=RANGE_MERGE_GAP_PIXELS):
+    """Clip, sort and merge half-open pixel ranges separated by small gaps."""
+    merged = []
+    for start, end in sorted(ranges):
+        start = max(0, int(start))
+        end = min(total_leds, int(end))
+        if start >= end:
+            continue
+        if merged and start - merged[-1][1] <= gap:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return merged
+
+
 class LEDController:
     """Control LED strips via SPI"""
     
@@ -159,6 +195,9 @@ class LEDController:
         self._receiver_last_accepted_sequence = 0
         self._receiver_last_displayed_sequence = 0
         self._frame_packet = bytearray(1 + self.total_leds * 3 + CRC_BYTES)
+        # SET_RANGE packets keyed by pixel count. Chunked frames and dirty
+        # ranges repeat a handful of sizes, so steady state allocates nothing.
+        self._range_packets = {}
         
         if self.debug:
             print("SPI Controller initialized")
@@ -172,7 +211,7 @@ class LEDController:
         
         # Test ping
         try:
-            self._xfer([CMD_PING])
+            self._transfer(PING_PACKET)
             time.sleep(0.01)
             if self.debug:
                 print("✓ SPI connection OK\n")
@@ -188,15 +227,35 @@ class LEDController:
         buf[:len(payload_view)] = payload_view
         return self._xfer_packet(buf, len(payload_view))
 
+    def _range_packet(self, start_pixel, count):
+        """Return a reused SET_RANGE buffer for count pixels, header filled."""
+        buf = self._range_packets.get(count)
+        if buf is None:
+            buf = bytearray(4 + count * 3 + CRC_BYTES)
+            self._range_packets[count] = buf
+        RANGE_HEADER.pack_into(buf, 0, CMD_SET_RANGE, start_pixel, count)
+        return buf
+
     def _xfer_packet(self, buf, payload_length):
         """Finalize and transfer a packet whose CRC storage is preallocated."""
         crc = _crc16_ccitt(memoryview(buf)[:payload_length])
-        buf[payload_length] = (crc >> 8) & 0xFF
-        buf[payload_length + 1] = crc & 0xFF
+        CRC_FIELD.pack_into(buf, payload_length, crc)
+        return self._transfer(buf)
+
+    def _transfer(self, buf):
+        """Send a packet whose CRC is already in place."""
         self._bytes_sent += len(buf)
         self._crc_bytes_sent += CRC_BYTES
         self._spi_transfers += 1
         try:
+            if len(buf) < RECEIVER_STATUS_BYTES:
+                # Too short to carry a status snapshot, so skip the MISO
+                # readback list xfer2 would build. Older spidev lacks
+                # writebytes2 and falls through to xfer2.
+                write_only = getattr(self.spi, 'writebytes2', None)
+                if write_only is not None:
+                    write_only(buf)
+                    return None
             response = self.spi.xfer2(buf)
             self._update_receiver_status(response)
             return response
@@ -334,12 +393,12 @@ class LEDController:
     def show(self):
         """Update the LED display"""
         self._refresh_configuration()
-        self._xfer([CMD_SHOW])
+        self._transfer(SHOW_PACKET)
     
     def clear(self):
         """Clear all LEDs"""
         self._refresh_configuration()
-        self._xfer([CMD_CLEAR])
+        self._transfer(CLEAR_PACKET)
     
     def set_range(self, start_pixel, colors):
         """
@@ -355,33 +414,33 @@ class LEDController:
 
         self._refresh_configuration()
 
-        data = [
-            CMD_SET_RANGE,
-            (start_pixel >> 8) & 0xFF,
-            start_pixel & 0xFF,
-            count
-        ]
-        
+        # Fill a reused packet with CRC room instead of growing a list of
+        # ints that _xfer would then copy into a second buffer.
+        payload_length = 4 + count * 3
+        buf = self._range_packet(start_pixel, count)
+        # A memoryview raises on a size mismatch (e.g. RGBA pixels) where
+        # bytearray slice assignment would resize the cached packet.
+        pixels = memoryview(buf)[4:payload_length]
+
         if isinstance(colors, np.ndarray):
             arr = colors[:count]
             if arr.dtype != np.uint8:
                 arr = np.clip(arr, 0, 255).astype(np.uint8)
-            data.extend(arr.tobytes())
+            pixels[:] = arr.tobytes()
         else:
-            for i in range(count):
-                r, g, b = colors[i]
-                data.extend([int(r) & 0xFF, int(g) & 0xFF, int(b) & 0xFF])
-        
-        self._xfer(data)
+            payload = bytearray()
+            for r, g, b in colors[:count]:
+                payload.extend((int(r) & 0xFF, int(g) & 0xFF, int(b) & 0xFF))
+            pixels[:] = payload
+
+        self._xfer_packet(buf, payload_length)
 
     def set_partial_frame(self, colors, dirty_ranges):
         """Apply changed half-open pixel ranges and latch one partial frame."""
         start_time = time.perf_counter()
         success = False
         try:
-            for start, end in dirty_ranges:
-                start = max(0, int(start))
-                end = min(self.total_leds, int(end))
+            for start, end in _coalesce_ranges(dirty_ranges, self.total_leds):
                 while start < end:
                     chunk_end = min(end, start + MAX_PIXELS_PER_RANGE)
                     self.set_range(start, colors[start:chunk_end])
@@ -449,14 +508,11 @@ class LEDController:
                 start = 0
                 while start < total_pixels:
                     count = min(MAX_PIXELS_PER_RANGE, total_pixels - start)
-                    buf = bytearray(4 + count * 3)
-                    buf[0] = CMD_SET_RANGE
-                    buf[1] = (start >> 8) & 0xFF
-                    buf[2] = start & 0xFF
-                    buf[3] = count
+                    payload_length = 4 + count * 3
+                    buf = self._range_packet(start, count)
                     if rgb_bytes is not None:
                         offset = start * 3
-                        buf[4:] = rgb_bytes[offset:offset + count * 3]
+                        buf[4:payload_length] = rgb_bytes[offset:offset + count * 3]
                     else:
                         idx = 4
                         for r, g, b in colors[start:start + count]:
@@ -464,10 +520,10 @@ class LEDController:
                             buf[idx + 1] = int(g) & 0xFF
                             buf[idx + 2] = int(b) & 0xFF
                             idx += 3
-                    self._xfer(buf)
+                    self._xfer_packet(buf, payload_length)
                     start += count
 
-                self._xfer(bytearray([CMD_SHOW]))
+                self._transfer(SHOW_PACKET)
             success = True
         finally:
             if success:
@@ -698,7 +754,6 @@ def main():
 
     except Exception as e:
         print(f"\nError: {e}")
-        import traceback
         traceback.print_exc()
     finally:
         if controller:
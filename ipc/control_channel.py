@@ -10,6 +10,29 @@ import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional C accelerator
+    orjson = None
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialize a channel payload, preferring orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; stdlib json handles them
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw_payload: str) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    # catch the stdlib type for either parser.
+    if orjson is not None:
+        return orjson.loads(raw_payload)
+    return json.loads(raw_payload)
+
 
 class FileControlChannel:
     """
@@ -24,6 +47,10 @@ class FileControlChannel:
         self.status_path = Path(status_path)
         self.control_path.parent.mkdir(parents=True, exist_ok=True)
         self.status_path.parent.mkdir(parents=True, exist_ok=True)
+        # Parsed status keyed by the file's stat signature, so concurrent web
+        # clients polling between controller writes share one JSON parse.
+        self._status_cache_key: Optional[tuple] = None
+        self._status_cache: Optional[Dict[str, Any]] = None
 
     def _atomic_write(self, path: Path, payload: Dict[str, Any]):
         fd, tmp_name = tempfile.mkstemp(
@@ -33,8 +60,8 @@ class FileControlChannel:
         )
         tmp_path = Path(tmp_name)
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as fh:
-                json.dump(payload, fh, separators=(",", ":"))
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(_dumps(payload))
                 fh.flush()
                 os.fsync(fh.fileno())
             tmp_path.replace(path)
@@ -82,7 +109,7 @@ class FileControlChannel:
             return None
 
         try:
-            parsed = json.loads(raw_payload)
+            parsed = _loads(raw_payload)
             return parsed if isinstance(parsed, dict) else None
         except json.JSONDecodeError as exc:
             recovered = self._recover_last_json_object(raw_payload)
@@ -116,7 +143,16 @@ class FileControlChannel:
         return payload
 
     def read_status(self) -> Optional[Dict[str, Any]]:
-        return self._read_json_file(self.status_path, "status")
+        try:
+            stat = self.status_path.stat()
+        except OSError:
+            return None
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if key != self._status_cache_key:
+            self._status_cache = self._read_json_file(self.status_path, "status")
+            self._status_cache_key = key
+        # Callers own the top level; nested values are shared and read-only.
+        return dict(self._status_cache) if self._status_cache is not None else None
 
     def write_status(self, payload: Dict[str, Any]):
         payload = dict(payload)
@@ -6,50 +6,33 @@ Supports running either the controller process (hardware + animation loop) or
 the web/preview UI as separate Python processes that communicate via files.
 """
 
-import argparse
 import sys
+
+# gevent's monkey patch must precede every socket/thread-using import below.
+if '--use-gevent' in sys.argv[1:]:
+    try:
+        from gevent import monkey
+    except ImportError:
+        pass  # run_web_mode reports the fallback
+    else:
+        monkey.patch_all()
+
+import argparse
 import time
+import traceback
 from pathlib import Path
 
 # Add repo root to Python path for imports
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from animation.core.manager import AnimationManager
+from animation.core.manager import AnimationManager, LEDController
 from ipc.control_channel import FileControlChannel
-from drivers.led_layout import DEFAULT_STRIP_COUNT, DEFAULT_LEDS_PER_STRIP, default_strip_count
+from drivers.led_layout import DEFAULT_LEDS_PER_STRIP, default_strip_count
 from drivers.frame_codec import decode_frame_data
 from web.app import create_app
 from animation.core.defaults import DEFAULT_ANIMATION_SPEED_SCALE, DEFAULT_PLANT_AWARE
 from tools.deployment.preserve_deploy_settings import load_saved_state, save_status
 
-# Try to import the real LED controller, fall back to mock for testing
-try:
-    from drivers.multi_device import MultiDeviceLEDController as LEDController
-except ImportError:
-    try:
-        from drivers.spi_controller import LEDController
-    except ImportError:
-        class LEDController:
-            def __init__(self, strips=DEFAULT_STRIP_COUNT, leds_per_strip=DEFAULT_LEDS_PER_STRIP, **kwargs):
-                self.strip_count = strips
-                self.leds_per_strip = leds_per_strip
-                self.total_leds = strips * leds_per_strip
-                self.debug = kwargs.get('debug', False)
-                self.inline_show = True
-                print(f"🔧 Mock LED Controller: {strips} strips × {leds_per_strip} LEDs = {self.total_leds} total")
-
-            def set_all_pixels(self, *_args, **_kwargs):
-                pass
-
-            def show(self):
-                pass
-
-            def clear(self):
-                pass
-
-            def configure(self):
-                pass
-
 
 def device_count_for_strips(strip_count: int, strips_per_device: int = 8) -> int:
     """Return enough devices to cover every configured strip."""
@@ -168,100 +151,158 @@ def run_controller_mode(args):
                 pass
 
 
+def _command_start(manager: AnimationManager, data: dict):
+    animation = data.get('animation')
+    config = data.get('config') or {}
+    print(f"▶️  Start requested: {animation}")
+    return manager.start_animation(animation, config)
+
+
+def _command_stop(manager: AnimationManager, data: dict):
+    print("⏹️  Stop requested")
+    manager.stop_animation()
+    return False
+
+
+def _command_update_params(manager: AnimationManager, data: dict):
+    params = data.get('params') or {}
+    if params:
+        print(f"⚙️  Update params: {params}")
+        return manager.update_animation_parameters(params)
+    return False
+
+
+def _command_set_target_fps(manager: AnimationManager, data: dict):
+    requested = data.get('target_fps')
+    try:
+        applied = manager.set_target_fps(int(requested))
+        print(f"🎚️ Target FPS: {applied}")
+        return True
+    except (TypeError, ValueError):
+        print(f"⚠️ Invalid target FPS: {requested!r}")
+    return False
+
+
+def _command_set_animation_speed_scale(manager: AnimationManager, data: dict):
+    requested = data.get('animation_speed_scale')
+    try:
+        applied = manager.set_animation_speed_scale(float(requested))
+        print(f"🎚️ Animation speed scale: {applied:.3f}")
+        return True
+    except (TypeError, ValueError):
+        print(f"⚠️ Invalid animation speed scale: {requested!r}")
+    return False
+
+
+def _command_set_plant_aware(manager: AnimationManager, data: dict):
+    requested = data.get('plant_aware')
+    try:
+        applied = manager.set_plant_aware(requested)
+        print(f"🌿 Plant-aware mode: {'on' if applied else 'off'}")
+        return True
+    except (TypeError, ValueError):
+        print(f"⚠️ Invalid plant-aware state: {requested!r}")
+    return False
+
+
+def _command_set_plant_modifiers(manager: AnimationManager, data: dict):
+    requested = data.get('plant_modifiers')
+    try:
+        applied = manager.set_plant_modifiers(requested)
+        print(f"🌿 Plant modifiers: {', '.join(applied['active']) or 'off'}")
+        return True
+    except (TypeError, ValueError):
+        print(f"⚠️ Invalid plant modifier state: {requested!r}")
+    return False
+
+
+def _command_refresh_plugins(manager: AnimationManager, data: dict):
+    animation = data.get('animation')
+    if animation:
+        print(f"🔄 Reload plugin: {animation}")
+        manager.reload_animation(animation)
+    else:
+        print("🔄 Refresh all plugins")
+        manager.refresh_plugins()
+    return False
+
+
+def _command_puncture_hole(manager: AnimationManager, data: dict):
+    x = data.get('x')
+    y = data.get('y')
+    radius = data.get('radius')
+    if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+        print(f"💥 Hole requested at ({x:.1f}, {y:.1f})")
+        manager.trigger_hole(float(x), float(y), radius)
+    else:
+        print("💥 Random hole requested")
+        manager.trigger_random_hole()
+    return False
+
+
+def _command_dpad(manager: AnimationManager, data: dict):
+    direction = (data.get('direction') or '').lower().replace('_', '-')
+    if manager.current_animation and hasattr(manager.current_animation, 'handle_input'):
+        manager.current_animation.handle_input(direction)
+    else:
+        print(f"⚠️ D-pad input ignored (no handler): {direction}")
+    return False
+
+
+def _command_painter_set_frame(manager: AnimationManager, data: dict):
+    frame_data = data.get('frame_data')
+    encoded = data.get('frame_data_encoded')
+    if isinstance(encoded, str) and encoded:
+        frame_data = decode_frame_data(encoded)
+    if isinstance(frame_data, list):
+        print(f"🖌️  Painter set frame ({len(frame_data)} pixels)")
+        manager.set_painter_frame(frame_data)
+    else:
+        print("⚠️ painter_set_frame ignored: missing frame payload")
+    return False
+
+
+def _command_painter_apply_updates(manager: AnimationManager, data: dict):
+    updates = data.get('updates') or []
+    if isinstance(updates, list):
+        applied = manager.apply_painter_updates(updates)
+        print(f"🖌️  Painter updates: {len(updates)} ({'applied' if applied else 'no changes'})")
+    else:
+        print("⚠️ painter_apply_updates ignored: updates must be a list")
+    return False
+
+
+def _command_painter_clear(manager: AnimationManager, data: dict):
+    print("🧽 Painter clear requested")
+    manager.clear_painter_frame()
+    return False
+
+
+# Each handler returns whether the command changed restart state.
+_COMMAND_HANDLERS = {
+    'start': _command_start,
+    'stop': _command_stop,
+    'update_params': _command_update_params,
+    'set_target_fps': _command_set_target_fps,
+    'set_animation_speed_scale': _command_set_animation_speed_scale,
+    'set_plant_aware': _command_set_plant_aware,
+    'set_plant_modifiers': _command_set_plant_modifiers,
+    'refresh_plugins': _command_refresh_plugins,
+    'puncture_hole': _command_puncture_hole,
+    'dpad': _command_dpad,
+    'painter_set_frame': _command_painter_set_frame,
+    'painter_apply_updates': _command_painter_apply_updates,
+    'painter_clear': _command_painter_clear,
+}
+
+
 def handle_command(manager: AnimationManager, action: str, data: dict):
     """Dispatch a command and report whether restart state changed."""
-    if action == 'start':
-        animation = data.get('animation')
-        config = data.get('config') or {}
-        print(f"▶️  Start requested: {animation}")
-        return manager.start_animation(animation, config)
-    elif action == 'stop':
-        print("⏹️  Stop requested")
-        manager.stop_animation()
-    elif action == 'update_params':
-        params = data.get('params') or {}
-        if params:
-            print(f"⚙️  Update params: {params}")
-            return manager.update_animation_parameters(params)
-    elif action == 'set_target_fps':
-        requested = data.get('target_fps')
-        try:
-            applied = manager.set_target_fps(int(requested))
-            print(f"🎚️ Target FPS: {applied}")
-            return True
-        except (TypeError, ValueError):
-            print(f"⚠️ Invalid target FPS: {requested!r}")
-    elif action == 'set_animation_speed_scale':
-        requested = data.get('animation_speed_scale')
-        try:
-            applied = manager.set_animation_speed_scale(float(requested))
-            print(f"🎚️ Animation speed scale: {applied:.3f}")
-            return True
-        except (TypeError, ValueError):
-            print(f"⚠️ Invalid animation speed scale: {requested!r}")
-    elif action == 'set_plant_aware':
-        requested = data.get('plant_aware')
-        try:
-            applied = manager.set_plant_aware(requested)
-            print(f"🌿 Plant-aware mode: {'on' if applied else 'off'}")
-            return True
-        except (TypeError, ValueError):
-            print(f"⚠️ Invalid plant-aware state: {requested!r}")
-    elif action == 'set_plant_modifiers':
-        requested = data.get('plant_modifiers')
-        try:
-            applied = manager.set_plant_modifiers(requested)
-            print(f"🌿 Plant modifiers: {', '.join(applied['active']) or 'off'}")
-            return True
-        except (TypeError, ValueError):
-            print(f"⚠️ Invalid plant modifier state: {requested!r}")
-    elif action == 'refresh_plugins':
-        animation = data.get('animation')
-        if animation:
-            print(f"🔄 Reload plugin: {animation}")
-            manager.reload_animation(animation)
-        else:
-            print("🔄 Refresh all plugins")
-            manager.refresh_plugins()
-    elif action == 'puncture_hole':
-        x = data.get('x')
-        y = data.get('y')
-        radius = data.get('radius')
-        if isinstance(x, (int, float)) and isinstance(y, (int, float)):
-            print(f"💥 Hole requested at ({x:.1f}, {y:.1f})")
-            manager.trigger_hole(float(x), float(y), radius)
-        else:
-            print("💥 Random hole requested")
-            manager.trigger_random_hole()
-    elif action == 'dpad':
-        direction = (data.get('direction') or '').lower().replace('_', '-')
-        if manager.current_animation and hasattr(manager.current_animation, 'handle_input'):
-            manager.current_animation.handle_input(direction)
-        else:
-            print(f"⚠️ D-pad input ignored (no handler): {direction}")
-    elif action == 'painter_set_frame':
-        frame_data = data.get('frame_data')
-        encoded = data.get('frame_data_encoded')
-        if isinstance(encoded, str) and encoded:
-            frame_data = decode_frame_data(encoded)
-        if isinstance(frame_data, list):
-            print(f"🖌️  Painter set frame ({len(frame_data)} pixels)")
-            manager.set_painter_frame(frame_data)
-        else:
-            print("⚠️ painter_set_frame ignored: missing frame payload")
-    elif action == 'painter_apply_updates':
-        updates = data.get('updates') or []
-        if isinstance(updates, list):
-            applied = manager.apply_painter_updates(updates)
-            print(f"🖌️  Painter updates: {len(updates)} ({'applied' if applied else 'no changes'})")
-        else:
-            print("⚠️ painter_apply_updates ignored: updates must be a list")
-    elif action == 'painter_clear':
-        print("🧽 Painter clear requested")
-        manager.clear_painter_frame()
-    else:
+    handler = _COMMAND_HANDLERS.get(action)
+    if handler is None:
         print(f"⚠️ Unknown action: {action}")
-    return False
+        return False
+    return handler(manager, data)
 
 
 def run_web_mode(args):
@@ -286,7 +327,12 @@ def run_web_mode(args):
     print(f"  Painter:   http://{args.host}:{args.port}/painter")
     print()
 
-    web_interface.run(debug=args.debug)
+    web_interface.run(
+        debug=args.debug,
+        use_gevent=args.use_gevent,
+        use_waitress=args.use_waitress,
+        waitress_threads=args.waitress_threads,
+    )
 
 
 def main():
@@ -319,6 +365,13 @@ def main():
                         help='Port to listen on (default: 5000)')
     parser.add_argument('--debug', action='store_true',
                         help='Enable debug mode for Flask')
+    parser.add_argument('--use-gevent', action='store_true',
+                        help='Serve the web UI with gevent instead of the Flask server (web mode)')
+    parser.add_argument('--use-waitress', action='store_true',
+                        help='Serve the web UI with waitress instead of the Flask server (web mode)')
+    parser.add_argument('--waitress-threads', type=int, default=8,
+                        help='Worker threads for --use-waitress (default: 8); each open '
+                             'dashboard live view holds one, up to 4 at a time')
 
     # Controller options
     parser.add_argument('--bus', type=int, default=0,
@@ -341,6 +394,14 @@ def main():
                         help='Seconds between status writes (controller mode)')
 
     args = parser.parse_args()
+    if args.use_gevent and args.mode == 'controller':
+        parser.error('--use-gevent only applies to --mode web')
+    if args.use_waitress and args.mode == 'controller':
+        parser.error('--use-waitress only applies to --mode web')
+    if args.use_waitress and args.use_gevent:
+        parser.error('--use-waitress and --use-gevent are mutually exclusive')
+    if args.waitress_threads < 1:
+        parser.error('--waitress-threads must be at least 1')
 
     print("🎨 LED Grid Animation Server")
     print("=" * 40)
@@ -359,7 +420,6 @@ def main():
             run_web_mode(args)
     except Exception as e:
         print(f"❌ Error starting server: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -0,0 +1,160 @@
+"""Tests for the web process's plugin metadata and preview caches."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from animation.core.preview_assets import empty_catalog, write_catalog
+from web import app as web_app
+from web.app import AnimationWebInterface
+
+
+class _Controller:
+    strip_count = 1
+    leds_per_strip = 1
+    total_leds = 1
+
+
+class _CountingManager:
+    controller = _Controller()
+    preview_controller = controller
+
+    def __init__(self):
+        self.list_calls = 0
+        self.info_calls = 0
+        self.preview_calls = 0
+
+    def list_animations(self):
+        self.list_calls += 1
+        return [
+            {'plugin_name': 'sparkle', 'name': 'Sparkle'},
+            {'plugin_name': 'aurora', 'name': 'Aurora'},
+        ]
+
+    def get_animation_info(self, name):
+        self.info_calls += 1
+        return {'plugin_name': name, 'parameters': {'speed': {'type': 'float'}}}
+
+    def get_animation_preview(self, name):
+        self.preview_calls += 1
+        return {'frame_data': [[self.preview_calls, 0, 0]], 'current_animation': name}
+
+    def reload_animation(self, _name):
+        return True
+
+    def refresh_plugins(self):
+        return ['aurora', 'sparkle']
+
+
+class _Channel:
+    def send_command(self, *_args, **_kwargs):
+        return None
+
+    def read_status(self):
+        return None
+
+
+class AnimationMetadataCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.manager = _CountingManager()
+        self.interface = AnimationWebInterface(_Channel(), self.manager)
+        self.client = self.interface.app.test_client()
+
+    def test_polling_reuses_metadata_until_plugins_change(self):
+        for _ in range(3):
+            names = [item['name'] for item in self.client.get('/api/animations').get_json()]
+            self.assertEqual(names, ['Aurora', 'Sparkle'])
+            self.client.get('/api/animations/sparkle')
+        self.assertEqual((self.manager.list_calls, self.manager.info_calls), (1, 1))
+
+        self.client.post('/api/reload/sparkle')
+        self.client.get('/api/animations')
+        self.client.get('/api/animations/sparkle')
+        self.assertEqual((self.manager.list_calls, self.manager.info_calls), (2, 2))
+
+        self.client.post('/api/refresh')
+        self.client.get('/api/animations')
+        self.assertEqual(self.manager.list_calls, 3)
+
+    def test_unknown_names_are_not_cached_and_the_cache_is_bounded(self):
+        self.manager.get_animation_info = lambda name: None
+        for index in range(50):
+            self.assertEqual(self.client.get(f'/api/animations/missing-{index}').status_code, 404)
+        self.assertEqual(self.interface._animation_metadata_cache, {})
+
+        self.manager.get_animation_info = lambda name: {'plugin_name': name}
+        for index in range(web_app.ANIMATION_METADATA_CACHE_MAX_ENTRIES + 10):
+            self.interface._animation_info(f'plugin-{index}')
+        self.assertLessEqual(
+            len(self.interface._animation_metadata_cache),
+            web_app.ANIMATION_METADATA_CACHE_MAX_ENTRIES,
+        )
+
+    def test_callers_cannot_mutate_cached_metadata(self):
+        self.interface._sorted_animations()[0]['name'] = 'Changed'
+        self.interface._animation_info('sparkle')['parameters'].clear()
+
+        self.assertEqual(self.interface._sorted_animations()[0]['name'], 'Aurora')
+        self.assertIn('speed', self.interface._animation_info('sparkle')['parameters'])
+
+    def test_default_previews_are_served_from_cache_until_reload(self):
+        first = self.client.get('/api/preview/sparkle').get_json()
+        self.assertEqual(self.client.get('/api/preview/sparkle').get_json(), first)
+        self.client.get('/api/preview/aurora')
+        self.assertEqual(self.manager.preview_calls, 2)
+
+        self.client.post('/api/reload/sparkle')
+        refreshed = self.client.get('/api/preview/sparkle').get_json()
+        self.assertEqual(refreshed['frame_data'], [[3, 0, 0]])
+
+    def test_batch_previews_share_the_per_animation_cache(self):
+        self.client.get('/api/preview/sparkle')
+        previews = self.client.get('/api/previews').get_json()['previews']
+
+        self.assertEqual(list(previews), ['aurora', 'sparkle'])
+        self.assertEqual(previews['sparkle']['frame_data'], [[1, 0, 0]])
+        self.assertEqual(previews['aurora']['current_animation'], 'aurora')
+        self.assertEqual(self.manager.preview_calls, 2)
+
+        self.client.get('/api/previews')
+        self.client.get('/api/preview/aurora')
+        self.assertEqual(self.manager.preview_calls, 2)
+
+    def test_failed_previews_are_not_cached(self):
+        self.manager.get_animation_preview = lambda name: {'frame_data': [], 'error': 'boom'}
+        self.client.get('/api/preview/sparkle')
+        self.assertEqual(self.interface._preview_cache, {})
+
+    def test_unchanged_listings_and_previews_revalidate_with_304(self):
+        for url in ('/api/animations', '/api/animations/sparkle', '/api/preview/sparkle'):
+            with self.subTest(url=url):
+                first = self.client.get(url)
+                etag = first.headers['ETag']
+                revalidated = self.client.get(url, headers={'If-None-Match': etag})
+                self.assertEqual(revalidated.status_code, 304)
+                self.assertEqual(revalidated.data, b'')
+                self.assertEqual(
+                    self.client.get(url, headers={'If-None-Match': '"stale"'}).status_code, 200
+                )
+
+    def test_preview_catalog_is_reread_only_after_a_rewrite(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.interface.generated_preview_dir = Path(directory) / 'generated'
+            self.interface.runtime_preview_dir = Path(directory) / 'runtime'
+            catalog = empty_catalog(1, 1)
+            catalog['animations']['sparkle'] = {'status': 'ready', 'poster_url': '/a.webp'}
+            write_catalog(self.interface.generated_preview_dir / 'catalog.json', catalog)
+
+            first = self.interface._preview_catalog()
+            self.assertIs(self.interface._preview_catalog(), first)
+            self.assertEqual(self.interface._preview_metadata('sparkle')['poster_url'], '/a.webp')
+
+            catalog['animations']['sparkle']['poster_url'] = '/runtime.webp'
+            write_catalog(self.interface.runtime_preview_dir / 'catalog.json', catalog)
+            self.assertEqual(
+                self.interface._preview_metadata('sparkle')['poster_url'], '/runtime.webp'
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+"""File control channel status caching tests."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from ipc.control_channel import FileControlChannel
+
+
+class FileControlChannelTests(unittest.TestCase):
+    def test_status_reads_track_rewrites_and_return_independent_copies(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            channel = FileControlChannel(str(root / "control.json"), str(root / "status.json"))
+            self.assertIsNone(channel.read_status())
+
+            channel.write_status({"frame_count": 1})
+            first = channel.read_status()
+            first["frame_count"] = 99
+            self.assertEqual(channel.read_status()["frame_count"], 1)
+
+            channel.write_status({"frame_count": 2})
+            self.assertEqual(channel.read_status()["frame_count"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
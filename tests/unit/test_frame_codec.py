@@ -0,0 +1,79 @@
+"""Status frame payload encoding tests."""
+
+import unittest
+
+import numpy as np
+
+from drivers.frame_codec import (
+    FRAME_PACKET_MAGIC,
+    RGB_FRAME_ENCODING_NAME,
+    FRAME_ENCODING_NAME,
+    decode_frame_array,
+    decode_frame_bytes,
+    decode_frame_data,
+    encode_frame_data,
+    encode_rgb_frame,
+    pack_frame_packet,
+    rgb_frame_bytes,
+    unpack_frame_packet,
+)
+
+
+class FrameCodecTests(unittest.TestCase):
+    def test_rgb_encoding_round_trips_to_pixel_lists(self):
+        frame = np.array([[0, 0, 0], [255, 128, 7], [91, 44, 93]], dtype=np.uint8)
+
+        encoded = encode_rgb_frame(frame)
+
+        self.assertEqual(
+            decode_frame_data(encoded, RGB_FRAME_ENCODING_NAME),
+            [[0, 0, 0], [255, 128, 7], [91, 44, 93]],
+        )
+
+    def test_json_encoding_remains_the_default(self):
+        frame = [[1, 2, 3], [4, 5, 6]]
+
+        self.assertEqual(decode_frame_data(encode_frame_data(frame)), frame)
+        self.assertEqual(decode_frame_data(encode_frame_data(frame), FRAME_ENCODING_NAME), frame)
+
+    def test_empty_rgb_frame_encodes_to_empty_string(self):
+        self.assertEqual(encode_rgb_frame(np.zeros((0, 3), dtype=np.uint8)), "")
+        self.assertEqual(decode_frame_data("", RGB_FRAME_ENCODING_NAME), [])
+
+    def test_frame_bytes_decode_both_encodings_to_packed_rgb(self):
+        frame = [[1, 2, 3], [250, 128, 0]]
+        packed = bytes([1, 2, 3, 250, 128, 0])
+
+        self.assertEqual(decode_frame_bytes(encode_frame_data(frame)), packed)
+        self.assertEqual(
+            decode_frame_bytes(encode_rgb_frame(np.array(frame)), RGB_FRAME_ENCODING_NAME),
+            packed,
+        )
+        self.assertEqual(decode_frame_bytes("not base64!"), b"")
+
+    def test_frame_array_decodes_to_rgb_rows(self):
+        frame = np.array([[1, 2, 3], [250, 128, 0]], dtype=np.uint8)
+
+        decoded = decode_frame_array(encode_rgb_frame(frame), RGB_FRAME_ENCODING_NAME)
+
+        self.assertEqual(decoded.dtype, np.uint8)
+        np.testing.assert_array_equal(decoded, frame)
+        self.assertEqual(decode_frame_array("").shape, (0, 3))
+
+    def test_rgb_frame_bytes_packs_triplets_and_rejects_other_shapes(self):
+        self.assertEqual(rgb_frame_bytes([(1, 2, 3), (4, 5, 6)]), bytes(range(1, 7)))
+        self.assertEqual(rgb_frame_bytes([]), b"")
+        self.assertEqual(rgb_frame_bytes([1, 2, 3]), b"")
+
+    def test_frame_packets_carry_magic_count_and_raw_rgb(self):
+        packet = pack_frame_packet(bytes([9, 8, 7, 6, 5, 4]))
+
+        self.assertEqual(packet[:4], FRAME_PACKET_MAGIC)
+        self.assertEqual(int.from_bytes(packet[4:8], "little"), 2)
+        self.assertEqual(unpack_frame_packet(packet), bytes([9, 8, 7, 6, 5, 4]))
+        self.assertEqual(unpack_frame_packet(packet[:-1]), b"")
+        self.assertEqual(unpack_frame_packet(b"XXXX" + packet[4:]), b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
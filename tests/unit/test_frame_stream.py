@@ -0,0 +1,227 @@
+"""Tests for the live frame endpoints' streaming and binary formats."""
+
+import base64
+import json
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from drivers.frame_codec import RGB_FRAME_ENCODING_NAME, encode_rgb_frame, unpack_frame_packet
+from web import app as web_app
+from web.app import AnimationWebInterface
+
+
+class _Controller:
+    strip_count = 1
+    leds_per_strip = 2
+    total_leds = 2
+
+
+class _PreviewManager:
+    controller = _Controller()
+    preview_controller = controller
+
+    def list_animations(self):
+        return []
+
+    def get_animation_preview(self, name):
+        # Plugins render into (N, 3) uint8 arrays, which previews pass through.
+        return {
+            'frame_data': np.array([[9, 8, 7], [6, 5, 4]], dtype=np.uint8),
+            'current_animation': name,
+        }
+
+    def get_animation_preview_with_params(self, name, _params):
+        return self.get_animation_preview(name)
+
+
+class _StatusChannel:
+    def __init__(self):
+        self.status = None
+
+    def write(self, frame_count, pixels):
+        self.status = {
+            'frame_count': frame_count,
+            'updated_at': 100.0 + frame_count,
+            'frame_data_encoded': encode_rgb_frame(np.array(pixels, dtype=np.uint8)),
+            'frame_encoding': RGB_FRAME_ENCODING_NAME,
+            'led_info': {'strip_count': 1, 'leds_per_strip': 2, 'total_leds': 2},
+        }
+
+    def read_status(self):
+        return self.status
+
+    def send_command(self, *_args, **_kwargs):
+        return None
+
+
+def _event_payload(event):
+    assert event.startswith('data: ') and event.endswith('\n\n'), event
+    return json.loads(event[len('data: '):])
+
+
+class FrameStreamTests(unittest.TestCase):
+    def setUp(self):
+        self.channel = _StatusChannel()
+        self.interface = AnimationWebInterface(self.channel, _PreviewManager())
+
+    def test_each_new_status_frame_is_streamed_once_as_packed_rgb(self):
+        events = self.interface._frame_events()
+        self.channel.write(1, [[255, 0, 0], [0, 0, 9]])
+
+        first = _event_payload(next(events))
+        self.assertEqual(first['frame_count'], 1)
+        self.assertEqual(base64.b64decode(first['frame_rgb']), bytes([255, 0, 0, 0, 0, 9]))
+        self.assertNotIn('frame_data', first)
+        self.assertNotIn('frame_data_encoded', first)
+
+        self.channel.write(2, [[1, 2, 3], [4, 5, 6]])
+        second = _event_payload(next(events))
+        self.assertEqual(second['frame_count'], 2)
+        self.assertEqual(base64.b64decode(second['frame_rgb']), bytes(range(1, 7)))
+
+    def test_binary_packets_follow_new_status_frames(self):
+        packets = self.interface._frame_packets()
+        self.channel.write(1, [[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(unpack_frame_packet(next(packets)), bytes(range(1, 7)))
+
+        self.channel.write(2, [[0, 0, 0], [255, 255, 255]])
+        self.assertEqual(unpack_frame_packet(next(packets)), bytes([0, 0, 0] + [255] * 3))
+
+    def test_idle_binary_streams_send_empty_keepalive_packets(self):
+        self.channel.write(1, [[1, 2, 3], [4, 5, 6]])
+        packets = self.interface._frame_packets()
+        self.assertEqual(unpack_frame_packet(next(packets)), bytes(range(1, 7)))
+
+        with mock.patch.object(web_app, 'FRAME_STREAM_KEEPALIVE_SECONDS', 0.0):
+            keepalive = next(packets)
+        self.assertEqual(keepalive, b'')
+        self.assertEqual(unpack_frame_packet(keepalive), b'')
+
+    def test_route_serves_an_event_stream(self):
+        self.channel.write(1, [[0, 0, 0], [0, 0, 0]])
+        response = self.interface.app.test_client().get('/api/frame/stream', buffered=False)
+        try:
+            self.assertEqual(response.mimetype, 'text/event-stream')
+            self.assertEqual(response.headers['Cache-Control'], 'no-cache')
+            self.assertTrue(next(response.response).startswith(b'data: '))
+        finally:
+            response.close()
+
+    def test_each_write_is_normalized_once_for_every_stream(self):
+        calls = []
+        normalize = self.interface._normalize_status
+
+        def counting_normalize(raw, *args, **kwargs):
+            calls.append(raw)
+            return normalize(raw, *args, **kwargs)
+
+        self.interface._normalize_status = counting_normalize
+        streams = [self.interface._status_frames() for _ in range(3)]
+        self.channel.write(1, [[0, 0, 0], [0, 0, 0]])
+
+        first = [next(frames) for frames in streams]
+        self.assertEqual([status['frame_count'] for status in first], [1, 1, 1])
+        first[0]['frame_count'] = 99
+        self.assertEqual(first[1]['frame_count'], 1)
+        for frames in streams:
+            self.assertIsNone(next(frames))
+        self.assertIsNone(next(streams[0]))
+        self.assertEqual(len(calls), 1)
+
+    def test_streams_leave_the_preview_manager_alone(self):
+        synced = []
+        self.interface.preview_manager.set_plant_modifiers = synced.append
+        self.interface._apply_preview_layout = synced.append
+        self.channel.write(1, [[0, 0, 0], [0, 0, 0]])
+
+        status = next(self.interface._status_frames())
+        self.assertEqual(status['led_info']['total_leds'], 2)
+        self.assertEqual(synced, [])
+
+    def test_streams_beyond_the_cap_are_refused_until_one_closes(self):
+        self.channel.write(1, [[0, 0, 0], [0, 0, 0]])
+        client = self.interface.app.test_client()
+        streams = [
+            client.get('/api/frame/stream', buffered=False)
+            for _ in range(web_app.FRAME_STREAM_MAX_CLIENTS)
+        ]
+        try:
+            self.assertTrue(all(stream.status_code == 200 for stream in streams))
+            refused = client.get('/api/frame/stream')
+            self.assertEqual(refused.status_code, 503)
+            self.assertIn('Retry-After', refused.headers)
+
+            streams.pop().close()
+            streams.append(client.get('/api/frame/stream', buffered=False))
+            self.assertEqual(streams[-1].status_code, 200)
+        finally:
+            for stream in reversed(streams):
+                stream.close()
+        self.assertEqual(self.interface._frame_stream_clients, 0)
+
+    def test_frame_endpoint_negotiates_msgpack_with_raw_pixel_bytes(self):
+        self.channel.write(3, [[7, 8, 9], [10, 11, 12]])
+        response = self.interface.app.test_client().get(
+            '/api/frame', headers={'Accept': 'application/msgpack'}
+        )
+
+        if web_app.msgpack is None:
+            # Without the optional packer the endpoint keeps answering in JSON.
+            self.assertEqual(response.mimetype, 'application/json')
+            self.assertEqual(response.get_json()['frame_data'], [[7, 8, 9], [10, 11, 12]])
+            return
+        self.assertEqual(response.mimetype, 'application/msgpack')
+        payload = web_app.msgpack.unpackb(response.data, raw=False)
+        self.assertEqual(payload['frame_data'], bytes([7, 8, 9, 10, 11, 12]))
+        self.assertEqual(payload['frame_count'], 3)
+
+    def test_frame_endpoint_defaults_to_json(self):
+        self.channel.write(4, [[1, 1, 1], [2, 2, 2]])
+        response = self.interface.app.test_client().get('/api/frame')
+
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(response.get_json()['frame_data'], [[1, 1, 1], [2, 2, 2]])
+
+    def test_negotiated_responses_vary_on_accept(self):
+        self.channel.write(5, [[1, 1, 1], [2, 2, 2]])
+        client = self.interface.app.test_client()
+        for accept in ('application/json', 'application/msgpack'):
+            for method, url in (
+                ('GET', '/api/frame'),
+                ('GET', '/api/preview/sparkle'),
+                ('POST', '/api/preview/sparkle/with_params'),
+            ):
+                with self.subTest(accept=accept, url=url):
+                    response = client.open(url, method=method, json={}, headers={'Accept': accept})
+                    self.assertIn('Accept', response.vary)
+
+    def test_json_frame_is_encoded_strip_by_strip(self):
+        status = {
+            'frame_count': 5,
+            'led_info': {'strip_count': 3, 'leds_per_strip': 1, 'total_leds': 3},
+            'frame_data': [[1, 2, 3], [4, 5, 6], [7, 8, 9]],
+        }
+        chunks = list(self.interface._json_frame_chunks(dict(status)))
+
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(json.loads(''.join(chunks)), status)
+
+        status['frame_data'] = []
+        self.assertEqual(json.loads(''.join(self.interface._json_frame_chunks(dict(status)))), status)
+
+    def test_array_previews_serialize_in_both_formats(self):
+        client = self.interface.app.test_client()
+        self.assertEqual(
+            client.get('/api/preview/sparkle').get_json()['frame_data'], [[9, 8, 7], [6, 5, 4]]
+        )
+
+        response = client.get('/api/preview/rainbow', headers={'Accept': 'application/msgpack'})
+        if web_app.msgpack is not None:
+            payload = web_app.msgpack.unpackb(response.data, raw=False)
+            self.assertEqual(payload['frame_data'], bytes([9, 8, 7, 6, 5, 4]))
+
+
+if __name__ == '__main__':
+    unittest.main()
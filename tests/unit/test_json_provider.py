@@ -0,0 +1,45 @@
+"""Tests for the web app's orjson-backed JSON provider."""
+
+import json
+import unittest
+from unittest import mock
+
+import numpy as np
+from flask import Flask, jsonify
+
+from web import app as web_app
+from web.app import OrjsonJSONProvider
+
+
+class OrjsonJSONProviderTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.json = OrjsonJSONProvider(self.app)
+
+    def test_responses_match_stdlib_json_for_plain_payloads(self):
+        payload = {'frame_data': [[1, 2, 3], [4, 5, 6]], 'name': 'Rainbow ✨', 'fps': 29.5}
+        with self.app.app_context():
+            response = jsonify(payload)
+
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(json.loads(response.get_data(as_text=True)), payload)
+
+    def test_values_orjson_rejects_fall_back_to_stdlib(self):
+        huge = 10 ** 30
+        self.assertEqual(json.loads(self.app.json.encode({'value': huge})), {'value': huge})
+        self.assertEqual(self.app.json.loads('{"speed": Infinity}'), {'speed': float('inf')})
+
+    @unittest.skipIf(web_app.orjson is None, 'orjson is not installed')
+    def test_numpy_values_serialize_natively(self):
+        encoded = self.app.json.encode({'pixels': np.array([[1, 2, 3]], dtype=np.uint8)})
+        self.assertEqual(json.loads(encoded), {'pixels': [[1, 2, 3]]})
+
+    def test_stdlib_fallback_serializes_numpy_values(self):
+        with mock.patch.object(web_app, 'orjson', None), self.app.app_context():
+            response = jsonify({'pixels': np.array([[4, 5, 6]], dtype=np.uint8), 'n': np.int64(7)})
+
+        self.assertEqual(response.get_json(), {'pixels': [[4, 5, 6]], 'n': 7})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -43,7 +43,7 @@ def main():
         decoded = raw_frame
     else:
         encoded = encoded or (raw_frame if isinstance(raw_frame, str) else "")
-        decoded = decode_frame_data(encoded)
+        decoded = decode_frame_data(encoded, payload.get("frame_encoding"))
 
     print(f"Decoded {len(decoded)} pixels from {status_path}")
 
@@ -8,6 +8,8 @@ import time
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add repo root to path so drivers package can be imported.
 REPO_ROOT = Path(__file__).resolve().parents[3]
 if str(REPO_ROOT) not in sys.path:
@@ -52,24 +54,22 @@ def test_strips_standalone():
         (255, 0, 255),    # Magenta
     ]
     
-    pixel_buffer = [(0, 0, 0)] * controller.total_leds
+    # A uint8 frame goes straight to set_all_pixels' bytes path; only the
+    # strip under test is rewritten each pass.
+    pixel_buffer = np.zeros((controller.total_leds, 3), dtype=np.uint8)
 
     for strip in range(controller.strip_count):
         if controller.debug:
             print(f"Testing strip {strip}...")
-        r, g, b = colors[strip % len(colors)]
-
-        for pixel in range(controller.leds_per_strip):
-            pixel_index = strip * controller.leds_per_strip + pixel
-            pixel_buffer[pixel_index] = (r, g, b)
+        start = strip * controller.leds_per_strip
+        end = start + controller.leds_per_strip
 
+        pixel_buffer[start:end] = colors[strip % len(colors)]
         controller.set_all_pixels(pixel_buffer)
         time.sleep(0.5)
 
         # Clear this strip in the local buffer for the next iteration
-        for pixel in range(controller.leds_per_strip):
-            pixel_index = strip * controller.leds_per_strip + pixel
-            pixel_buffer[pixel_index] = (0, 0, 0)
+        pixel_buffer[start:end] = 0
     
     if controller.debug:
         print("Test complete!")
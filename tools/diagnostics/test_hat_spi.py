@@ -11,7 +11,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from drivers.spi_controller import CMD_PING, LEDController
+from drivers.spi_controller import PING_PACKET, LEDController
 from drivers.led_layout import DEFAULT_LEDS_PER_STRIP
 
 ACTIVE_SPI_ON = re.compile(r"^\s*dtparam=spi=on\s*$", re.MULTILINE)
@@ -66,7 +66,7 @@ def ping_device(label: str, bus: int, device: int) -> bool:
             leds_per_strip=DEFAULT_LEDS_PER_STRIP,
             debug=True,
         )
-        controller._xfer([CMD_PING])
+        controller._transfer(PING_PACKET)
         print(f"{label}: PING OK")
         return True
     except Exception as exc:
@@ -6,15 +6,29 @@ Flask-based web server for controlling animations and adjusting parameters in
 real time.
 """
 
+import base64
+import copy
+import hashlib
 import json
 import math
 import os
 import re
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from flask import Flask, jsonify, render_template, request, send_from_directory
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from flask import (
+    Flask,
+    Response,
+    jsonify,
+    render_template,
+    request,
+    send_from_directory,
+    stream_with_context,
+)
+from flask.json.provider import DefaultJSONProvider
 
 from animation.core.manager import AnimationManager, PreviewLEDController
 from animation.core.defaults import DEFAULT_ANIMATION_SPEED_SCALE, DEFAULT_PLANT_AWARE
@@ -23,12 +37,106 @@ from animation.core.preview_assets import load_catalog, merge_catalogs
 from ipc.control_channel import FileControlChannel
 from drivers.led_layout import DEFAULT_STRIP_COUNT, DEFAULT_LEDS_PER_STRIP
 from drivers.frame_codec import (
+    decode_frame_array,
+    decode_frame_bytes,
     decode_frame_data,
     encode_frame_data,
+    pack_frame_packet,
+    rgb_frame_bytes,
     FRAME_ENCODING_NAME,
 )
 from web.preview_worker import RuntimePreviewWorker
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional C accelerator
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional binary frame format
+    msgpack = None
+
+try:
+    from flask_sock import Sock
+except ImportError:  # pragma: no cover - optional WebSocket support
+    Sock = None
+
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+_HEX_COLOR = re.compile(r'#[0-9a-fA-F]{6}')
+_UNSAFE_ID_CHARS = re.compile(r'[^a-zA-Z0-9_-]+')
+_REPEATED_UNDERSCORES = re.compile(r'_+')
+# Exactly the strings _sanitize_preset_id maps to themselves (up to 64 chars).
+_SAFE_ID = re.compile(r'[a-z0-9-]+(?:_[a-z0-9-]+)*')
+
+# Upper bound on how stale listed plugin metadata may get between refreshes.
+ANIMATION_METADATA_CACHE_SECONDS = 30.0
+# Like PREVIEW_CACHE_MAX_ENTRIES: past this many entries the cache starts over.
+ANIMATION_METADATA_CACHE_MAX_ENTRIES = 256
+# How often /api/frame/stream checks for a new status frame, and how long it
+# may stay silent before sending a keep-alive comment.
+FRAME_STREAM_POLL_SECONDS = 0.05
+FRAME_STREAM_KEEPALIVE_SECONDS = 15.0
+# Each open stream pins a server worker thread; past this many, new clients
+# get a 503 and the dashboard falls back to polling /api/status.
+FRAME_STREAM_MAX_CLIENTS = 4
+# Default previews are memoized until plugins change; past this many entries
+# (stale plugin versions, layouts, plant states) the cache starts over.
+PREVIEW_CACHE_MAX_ENTRIES = 256
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes responses with orjson when installed.
+
+    ``dumps`` stays on the stdlib so request bodies built by callers (and the
+    test client) keep writing NaN/Infinity literals; anything orjson rejects,
+    such as integers beyond 64 bits, also falls back to the stdlib.
+    """
+
+    def encode(self, obj: Any) -> str:
+        """Compact JSON text for a response body."""
+        return self.encode_bytes(obj).decode('utf-8')
+
+    def encode_bytes(self, obj: Any) -> bytes:
+        """Compact UTF-8 JSON for a response body, without a str round trip."""
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    obj,
+                    default=self.default,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                )
+            except TypeError:
+                pass
+        return self.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        """Let the stdlib fallback handle the numpy values orjson serializes."""
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+        if isinstance(o, np.generic):
+            return o.item()
+        return DefaultJSONProvider.default(o)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        if orjson is None or pretty:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.encode_bytes(obj) + b"\n", mimetype=self.mimetype)
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if orjson is not None and not kwargs:
+            try:
+                return orjson.loads(s)
+            except orjson.JSONDecodeError:
+                # The stdlib parser also accepts NaN/Infinity and big integers,
+                # which request validation reports with specific messages.
+                pass
+        return super().loads(s, **kwargs)
+
+
 class AnimationWebInterface:
     """Web interface for animation management"""
 
@@ -73,8 +181,33 @@ class AnimationWebInterface:
                 leds_per_strip=self.preview_manager.controller.leds_per_strip,
             )
 
+        # Last decoded status frame, shared by every client polling the same
+        # controller write.
+        self._decoded_frame_cache: Tuple[Any, Any, np.ndarray] = (
+            None, None, np.zeros((0, 3), dtype=np.uint8)
+        )
+        self._stream_frame_cache: Tuple[Any, Any, bytes] = (None, None, b'')
+        # Open /api/frame/stream and /ws/frame clients, each holding a worker.
+        self._frame_stream_clients = 0
+        self._frame_stream_lock = threading.Lock()
+        # Shared by every open stream: whichever is due polls the status file,
+        # normalizes a new write once, and wakes the rest (see _status_frames).
+        self._frame_feed = threading.Condition()
+        self._frame_feed_key: Any = object()
+        self._frame_feed_status: Dict[str, Any] = {}
+        self._frame_feed_seq = 0
+        self._frame_feed_polled_at = float('-inf')
+        # Plugin metadata only changes on reload/refresh; polling reads it
+        # from here instead of re-instantiating every plugin per request.
+        self._animation_metadata_cache: Dict[Any, Tuple[float, Any]] = {}
+        # Serialized default previews; see _preview_cache_key for what they
+        # depend on.
+        self._preview_cache: Dict[Tuple[Any, ...], Tuple[bytes, str]] = {}
+        self._preview_catalog_cache: Tuple[Any, Dict[str, Any]] = (None, {})
+
         # Create Flask app
         self.app = Flask(__name__)
+        self.app.json = OrjsonJSONProvider(self.app)
         self.app.secret_key = 'led-grid-secret-key-change-in-production'
 
         self.painter_presets_dir.mkdir(parents=True, exist_ok=True)
@@ -104,7 +237,7 @@ class AnimationWebInterface:
         def api_list_animations():
             """API: Get list of available animations"""
             animations = self._sorted_animations()
-            return jsonify(animations)
+            return self._with_etag(jsonify(animations))
 
         @self.app.route('/preview-assets/runtime/<path:filename>')
         def runtime_preview_asset(filename: str):
@@ -123,9 +256,9 @@ class AnimationWebInterface:
         @self.app.route('/api/animations/<animation_name>')
         def api_get_animation(animation_name):
             """API: Get detailed info about specific animation"""
-            info = self.preview_manager.get_animation_info(animation_name)
+            info = self._animation_info(animation_name)
             if info:
-                return jsonify(info)
+                return self._with_etag(jsonify(info))
             return jsonify({'error': 'Animation not found'}), 404
 
         @self.app.route('/api/animations/<animation_name>/presets')
@@ -235,13 +368,13 @@ class AnimationWebInterface:
         @self.app.route('/api/status')
         def api_get_status():
             """API: Get current status"""
-            return jsonify(self._status_payload())
+            return self._with_etag(jsonify(self._status_payload()))
         
         @self.app.route('/api/stats')
         def api_get_stats():
             """API: Runtime stats payload that mirrors /api/status"""
             status = self._status_payload()
-            return jsonify(status)
+            return self._with_etag(jsonify(status))
 
         @self.app.route('/api/metrics')
         def api_get_metrics():
@@ -342,7 +475,49 @@ class AnimationWebInterface:
         @self.app.route('/api/frame')
         def api_get_frame():
             """API: Get current animation frame data"""
-            return jsonify(self._status_payload(decode_frame=True))
+            if self._wants_msgpack():
+                status = self._status_payload()
+                status['frame_data'] = decode_frame_bytes(
+                    status.pop('frame_data_encoded'), status['frame_encoding']
+                )
+                return self._vary_on_accept(self._msgpack_response(status))
+            return self._vary_on_accept(Response(
+                stream_with_context(self._json_frame_chunks(self._status_payload(decode_frame=True))),
+                mimetype='application/json',
+            ))
+
+        @self.app.route('/api/frame/stream')
+        def api_frame_stream():
+            """API: Server-Sent Events feed of status frames as they are written"""
+            if not self._acquire_frame_stream():
+                response = jsonify({'error': 'Too many live frame streams; poll /api/frame'})
+                response.status_code = 503
+                response.headers['Retry-After'] = '30'
+                return response
+            response = Response(
+                stream_with_context(self._frame_events()),
+                mimetype='text/event-stream',
+            )
+            # Runs even if the server drops the response before iterating it.
+            response.call_on_close(self._release_frame_stream)
+            response.headers['Cache-Control'] = 'no-cache'
+            response.headers['X-Accel-Buffering'] = 'no'
+            return response
+
+        if Sock is not None:
+            sock = Sock(self.app)
+
+            @sock.route('/ws/frame')
+            def ws_frame(ws):
+                """WebSocket: binary frame packets as they are written"""
+                if not self._acquire_frame_stream():
+                    ws.close(reason=1013, message='Too many live frame streams')
+                    return
+                try:
+                    for packet in self._frame_packets():
+                        ws.send(packet)
+                finally:
+                    self._release_frame_stream()
 
         @self.app.route('/api/painter/updates', methods=['POST'])
         def api_painter_apply_updates():
@@ -433,19 +608,32 @@ class AnimationWebInterface:
         def api_get_preview(animation_name):
             """API: Get preview frame data for a specific animation"""
             try:
-                self._sync_preview_layout_from_status()
-                # Get a sample frame from the animation without starting it
-                preview_data = self.preview_manager.get_animation_preview(animation_name)
-                return jsonify(preview_data)
+                led_info = self._sync_preview_layout_from_status()
+                response = self._default_preview(animation_name, led_info, self._wants_msgpack())
+                return self._with_etag(self._vary_on_accept(response))
             except Exception as e:
-                return jsonify({
-                    'error': f'Failed to get preview for {animation_name}: {str(e)}',
-                    'frame_data': [],
-                    'led_info': self._fallback_led_info(),
-                    'is_running': False,
-                    'frame_count': 0,
-                    'timestamp': time.time()
-                }), 500
+                return self._preview_error(animation_name, e)
+
+        @self.app.route('/api/previews')
+        def api_get_previews():
+            """API: Default preview frames for every animation in one response"""
+            led_info = self._sync_preview_layout_from_status()
+            names = [
+                animation['plugin_name'] for animation in self._sorted_animations()
+                if animation.get('plugin_name')
+            ]
+            # Rendered one after another: previews share the preview manager
+            # and its controller, and the plugins are mostly GIL-bound anyway.
+            encode = self.app.json.encode_bytes
+            entries = []
+            for name in names:
+                try:
+                    body = self._default_preview(name, led_info, False).get_data().rstrip(b'\n')
+                except Exception as e:
+                    body = encode({'error': f'Failed to get preview for {name}: {str(e)}'})
+                entries.append(encode(name) + b':' + body)
+            body = b'{"previews":{' + b','.join(entries) + b'}}\n'
+            return self._with_etag(Response(body, mimetype='application/json'))
 
         @self.app.route('/api/preview/<animation_name>/with_params', methods=['POST'])
         def api_get_preview_with_params(animation_name):
@@ -454,16 +642,11 @@ class AnimationWebInterface:
                 self._sync_preview_layout_from_status()
                 params = request.get_json() or {}
                 preview_data = self.preview_manager.get_animation_preview_with_params(animation_name, params)
-                return jsonify(preview_data)
+                return self._vary_on_accept(
+                    self._preview_response(preview_data, self._wants_msgpack())
+                )
             except Exception as e:
-                return jsonify({
-                    'error': f'Failed to get preview for {animation_name}: {str(e)}',
-                    'frame_data': [],
-                    'led_info': self._fallback_led_info(),
-                    'is_running': False,
-                    'frame_count': 0,
-                    'timestamp': time.time()
-                }), 500
+                return self._preview_error(animation_name, e)
         
         @self.app.route('/api/parameters', methods=['POST'])
         def api_update_parameters():
@@ -493,6 +676,8 @@ class AnimationWebInterface:
         def api_reload_animation(animation_name):
             """API: Reload specific animation plugin"""
             success = self.preview_manager.reload_animation(animation_name)
+            self._animation_metadata_cache.clear()
+            self._preview_cache.clear()
             if success:
                 self.control_channel.send_command('refresh_plugins', animation=animation_name)
             return jsonify({'success': success})
@@ -501,6 +686,8 @@ class AnimationWebInterface:
         def api_refresh_plugins():
             """API: Refresh all plugins"""
             plugins = self.preview_manager.refresh_plugins()
+            self._animation_metadata_cache.clear()
+            self._preview_cache.clear()
             self.control_channel.send_command('refresh_plugins')
             return jsonify({'success': True, 'plugins': plugins})
         
@@ -540,13 +727,32 @@ class AnimationWebInterface:
         return catalog
 
     def _preview_catalog(self) -> Dict[str, Any]:
-        """Merge deploy-generated previews with target-owned runtime previews."""
-        if self.local_mode:
-            return load_catalog(self.generated_preview_dir / "catalog.json")
-        return merge_catalogs(
-            load_catalog(self.generated_preview_dir / "catalog.json"),
-            load_catalog(self.runtime_preview_dir / "catalog.json"),
-        )
+        """Merge deploy-generated previews with target-owned runtime previews.
+
+        A page render consults the catalog once per animation and preset, so
+        the merged result is reused until a catalog file is rewritten. Callers
+        must treat it as read-only.
+        """
+        paths = [self.generated_preview_dir / "catalog.json"]
+        if not self.local_mode:
+            paths.append(self.runtime_preview_dir / "catalog.json")
+        signature = tuple((path, self._file_signature(path)) for path in paths)
+        cached_signature, catalog = self._preview_catalog_cache
+        if signature != cached_signature:
+            if self.local_mode:
+                catalog = load_catalog(paths[0])
+            else:
+                catalog = merge_catalogs(*(load_catalog(path) for path in paths))
+            self._preview_catalog_cache = (signature, catalog)
+        return catalog
+
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
 
     def _preview_metadata(
         self, animation_name: str, preset_id: Optional[str] = None
@@ -566,14 +772,37 @@ class AnimationWebInterface:
             return fallback
         return None
 
+    def _cached_metadata(self, key: Any, build: Callable[[], Any]) -> Any:
+        """Memoize plugin metadata for ``ANIMATION_METADATA_CACHE_SECONDS``.
+
+        Misses (``None``) are not cached, so unknown names cannot grow it.
+        """
+        now = time.monotonic()
+        entry = self._animation_metadata_cache.get(key)
+        if entry is not None and now - entry[0] < ANIMATION_METADATA_CACHE_SECONDS:
+            return copy.deepcopy(entry[1])
+        value = build()
+        if value is None:
+            return None
+        if len(self._animation_metadata_cache) >= ANIMATION_METADATA_CACHE_MAX_ENTRIES:
+            self._animation_metadata_cache.clear()
+        self._animation_metadata_cache[key] = (now, value)
+        return copy.deepcopy(value)
+
+    def _animation_info(self, animation_name: str) -> Optional[Dict[str, Any]]:
+        return self._cached_metadata(
+            ('info', animation_name),
+            lambda: self.preview_manager.get_animation_info(animation_name),
+        )
+
     def _sorted_animations(self) -> List[Dict[str, Any]]:
         """Return animation metadata alphabetized by its display name."""
-        return sorted(
+        return self._cached_metadata('list', lambda: sorted(
             self.preview_manager.list_animations(),
             key=lambda animation: str(
                 animation.get('name') or animation.get('plugin_name') or ''
             ).casefold(),
-        )
+        ))
 
     @staticmethod
     def _preset_emoji(preset: Dict[str, Any], fallback: str) -> str:
@@ -602,7 +831,7 @@ class AnimationWebInterface:
         if isinstance(palette, dict) and isinstance(palette.get('colors'), list):
             colors = [
                 color.upper() for color in palette['colors']
-                if isinstance(color, str) and re.fullmatch(r'#[0-9a-fA-F]{6}', color)
+                if isinstance(color, str) and _HEX_COLOR.fullmatch(color)
             ]
             if colors:
                 return colors[:3]
@@ -628,7 +857,7 @@ class AnimationWebInterface:
         self, animation_name: str, params: Dict[str, Any]
     ) -> Optional[str]:
         """Validate runtime preset parameters against the plugin schema."""
-        info = self.preview_manager.get_animation_info(animation_name)
+        info = self._animation_info(animation_name)
         if not info:
             return f"Unknown animation: {animation_name}"
         schema = info.get('parameters')
@@ -664,16 +893,55 @@ class AnimationWebInterface:
                     return f"Parameter {name} must be at most {definition['max']}"
         return None
     
-    def run(self, debug=False):
-        """Start the web server"""
+    def run(self, debug=False, use_gevent=False, use_waitress=False, waitress_threads=8):
+        """Start the web server.
+
+        With ``use_gevent`` the app is served by gevent's WSGIServer so many
+        polling clients multiplex on greenlets; the caller must have applied
+        ``gevent.monkey.patch_all()`` before importing anything socket-based.
+        ``use_waitress`` serves it from waitress's fixed worker pool instead
+        of a thread per request; each open frame stream holds one worker.
+        Debug mode and a missing server package fall back to the Flask server.
+        """
         print(f"🌐 Starting web interface at http://{self.host}:{self.port}")
         print(f"   Dashboard: http://{self.host}:{self.port}/")
         print(f"   Control:   http://{self.host}:{self.port}/control")
         print(f"   Painter:   http://{self.host}:{self.port}/painter")
         print(f"   Emoji:     http://{self.host}:{self.port}/emoji")
 
+        if use_gevent and not debug:
+            try:
+                from gevent.pywsgi import WSGIServer
+            except ImportError:
+                print("⚠️ gevent is not installed; falling back to the Flask server")
+            else:
+                print("   Server:    gevent WSGIServer")
+                WSGIServer((self.host, self.port), self.app).serve_forever()
+                return
+
+        if use_waitress and not debug:
+            try:
+                from waitress import serve
+            except ImportError:
+                print("⚠️ waitress is not installed; falling back to the Flask server")
+            else:
+                print(f"   Server:    waitress ({waitress_threads} threads)")
+                serve(self.app, host=self.host, port=self.port, threads=waitress_threads)
+                return
+
         self.app.run(host=self.host, port=self.port, debug=debug, threaded=True)
 
+    def _preview_error(self, animation_name: str, error: Exception):
+        """500 response for a preview that failed before the manager answered."""
+        return jsonify({
+            'error': f'Failed to get preview for {animation_name}: {str(error)}',
+            'frame_data': [],
+            'led_info': self._fallback_led_info(),
+            'is_running': False,
+            'frame_count': 0,
+            'timestamp': time.time()
+        }), 500
+
     def _fallback_led_info(self) -> Dict[str, int]:
         """Current preview-manager dimensions used as a fallback layout."""
         return {
@@ -752,7 +1020,7 @@ class AnimationWebInterface:
 
         encoded = payload.get('frame_data_encoded')
         if isinstance(encoded, str) and encoded:
-            decoded = decode_frame_data(encoded)
+            decoded = decode_frame_data(encoded, payload.get('frame_encoding'))
             return self._normalize_frame_data(decoded, led_info=led_info)
 
         return None
@@ -760,10 +1028,15 @@ class AnimationWebInterface:
     @staticmethod
     def _sanitize_preset_id(raw_name: str) -> str:
         """Convert user-provided preset names to a filesystem-safe id."""
-        cleaned = re.sub(r'[^a-zA-Z0-9_-]+', '_', (raw_name or '').strip().lower())
-        cleaned = re.sub(r'_+', '_', cleaned).strip('_')
+        cleaned = _UNSAFE_ID_CHARS.sub('_', (raw_name or '').strip().lower())
+        cleaned = _REPEATED_UNDERSCORES.sub('_', cleaned).strip('_')
         return cleaned[:64]
 
+    @staticmethod
+    def _is_safe_id(name: str) -> bool:
+        """True when ``name`` is already its own sanitized preset id."""
+        return len(name) <= 64 and _SAFE_ID.fullmatch(name) is not None
+
     def _preset_path(self, preset_id: str) -> Optional[Path]:
         """Resolve a preset id to a file path in the painter preset directory."""
         safe_id = self._sanitize_preset_id(preset_id)
@@ -843,15 +1116,13 @@ class AnimationWebInterface:
 
     def _animation_preset_dir(self, animation_name: str) -> Optional[Path]:
         """Resolve the writable runtime-preset directory for an animation."""
-        safe_name = self._sanitize_preset_id(animation_name)
-        if not safe_name or safe_name != animation_name:
+        if not self._is_safe_id(animation_name):
             return None
-        return self.animation_presets_dir / safe_name
+        return self.animation_presets_dir / animation_name
 
     def _curated_animation_preset_dir(self, animation_name: str) -> Optional[Path]:
         """Resolve the read-only preset directory owned by a plugin package."""
-        safe_name = self._sanitize_preset_id(animation_name)
-        if not safe_name or safe_name != animation_name:
+        if not self._is_safe_id(animation_name):
             return None
         loader = getattr(self.preview_manager, 'plugin_loader', None)
         plugin_dir = loader.get_plugin_dir(animation_name) if loader is not None else None
@@ -972,12 +1243,23 @@ class AnimationWebInterface:
 
     def _status_payload(self, decode_frame: bool = False) -> Dict[str, Any]:
         """Normalize the controller status so every consumer sees the same structure."""
-        raw_status = self.control_channel.read_status()
+        return self._normalize_status(self.control_channel.read_status(), decode_frame)
+
+    def _normalize_status(
+        self,
+        raw_status: Optional[Dict[str, Any]],
+        decode_frame: bool = False,
+        sync_preview: bool = True,
+    ) -> Dict[str, Any]:
+        """Normalize one raw status; ``sync_preview=False`` leaves the preview manager alone."""
         if not raw_status:
             return self._empty_status()
 
         status = dict(raw_status)
-        status['led_info'] = self._sync_preview_layout_from_status(status)
+        if sync_preview:
+            status['led_info'] = self._sync_preview_layout_from_status(status)
+        else:
+            status['led_info'] = self._normalize_led_info(status.get('led_info'))
         stats = status.get('animation_stats') or status.get('stats') or {}
         status['animation_stats'] = stats
         status['stats'] = stats
@@ -998,7 +1280,7 @@ class AnimationWebInterface:
             'plant_modifiers',
             PlantModifierState.from_legacy(DEFAULT_PLANT_AWARE).to_dict(),
         )
-        if not self.local_mode and hasattr(self.preview_manager, 'set_plant_modifiers'):
+        if sync_preview and not self.local_mode and hasattr(self.preview_manager, 'set_plant_modifiers'):
             try:
                 self.preview_manager.set_plant_modifiers(status['plant_modifiers'])
             except ValueError:
@@ -1034,12 +1316,226 @@ class AnimationWebInterface:
             if isinstance(raw_frame_list, list):
                 status['frame_data'] = raw_frame_list
             else:
-                status['frame_data'] = decode_frame_data(encoded_frame or '')
+                status['frame_data'] = self._decoded_frame(
+                    encoded_frame or '', status['frame_encoding']
+                )
         else:
             status['frame_data'] = []
 
         return status
 
+    def _decoded_frame(self, encoded: str, encoding: Optional[str]) -> np.ndarray:
+        """Decode a status frame once per controller write, not once per request.
+
+        The ``(N, 3)`` array goes to the JSON provider as is; orjson writes it
+        without building per-pixel lists.
+        """
+        cached_encoded, cached_encoding, frame = self._decoded_frame_cache
+        if encoded != cached_encoded or encoding != cached_encoding:
+            frame = decode_frame_array(encoded, encoding)
+            self._decoded_frame_cache = (encoded, encoding, frame)
+        return frame
+
+    @staticmethod
+    def _with_etag(response: Response) -> Response:
+        """Tag a response with a content hash; matching revalidations get a 304."""
+        response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest())
+        return response.make_conditional(request)
+
+    @staticmethod
+    def _wants_msgpack() -> bool:
+        """True when msgpack is installed and the client prefers it over JSON."""
+        if msgpack is None:
+            return False
+        best = request.accept_mimetypes.best_match(['application/json', MSGPACK_MIMETYPE])
+        return best == MSGPACK_MIMETYPE
+
+    @staticmethod
+    def _vary_on_accept(response: Response) -> Response:
+        """Mark a response whose body format follows ``_wants_msgpack``.
+
+        Without it a cache could replay a msgpack body (or its ETag) to a JSON
+        client, or the other way round.
+        """
+        response.vary.add('Accept')
+        return response
+
+    @staticmethod
+    def _msgpack_response(payload: Dict[str, Any]) -> Response:
+        """Pack a frame payload whose ``frame_data`` is raw RGB bytes."""
+        return Response(msgpack.packb(payload, use_bin_type=True), mimetype=MSGPACK_MIMETYPE)
+
+    def _default_preview(
+        self, animation_name: str, led_info: Dict[str, int], as_msgpack: bool
+    ) -> Response:
+        """Serialized default preview, memoized under ``_preview_cache_key``."""
+        cache_key = self._preview_cache_key(animation_name, led_info, as_msgpack)
+        cached = self._preview_cache.get(cache_key)
+        if cached is not None:
+            body, mimetype = cached
+            return Response(body, mimetype=mimetype)
+        # Get a sample frame from the animation without starting it
+        preview_data = self.preview_manager.get_animation_preview(animation_name)
+        response = self._preview_response(preview_data, as_msgpack)
+        if 'error' not in preview_data:
+            if len(self._preview_cache) >= PREVIEW_CACHE_MAX_ENTRIES:
+                self._preview_cache.clear()
+            self._preview_cache[cache_key] = (response.get_data(), response.mimetype)
+        return response
+
+    def _preview_cache_key(
+        self, animation_name: str, led_info: Dict[str, int], as_msgpack: bool
+    ) -> Tuple[Any, ...]:
+        """Everything a default preview depends on besides the plugin's code.
+
+        The plugin file's mtime stands in for the code, so editing a plugin in
+        place invalidates its preview even without a reload.
+        """
+        loader = getattr(self.preview_manager, 'plugin_loader', None)
+        plugin_file = loader.get_plugin_file(animation_name) if loader is not None else None
+        try:
+            mtime = plugin_file.stat().st_mtime_ns if plugin_file is not None else None
+        except OSError:
+            mtime = None
+        plant_state = getattr(self.preview_manager, 'plant_modifier_state', None)
+        plant_modifiers = (
+            json.dumps(plant_state.to_dict(), sort_keys=True)
+            if hasattr(plant_state, 'to_dict') else None
+        )
+        return (
+            animation_name,
+            mtime,
+            led_info['strip_count'],
+            led_info['leds_per_strip'],
+            plant_modifiers,
+            as_msgpack,
+        )
+
+    def _preview_response(self, preview_data: Dict[str, Any], as_msgpack: bool) -> Response:
+        if not as_msgpack:
+            return self.app.json.response(preview_data)
+        packed = dict(preview_data)
+        frame = packed.get('frame_data')
+        packed['frame_data'] = rgb_frame_bytes(frame if frame is not None else [])
+        return self._msgpack_response(packed)
+
+    def _json_frame_chunks(self, status: Dict[str, Any]) -> Iterator[str]:
+        """Encode a status payload one strip of ``frame_data`` at a time.
+
+        The response starts flowing before the whole frame is encoded, and no
+        single string holds the full document.
+        """
+        frame = status.pop('frame_data')
+        encode = self.app.json.encode
+        head = encode(status)
+        yield head[:-1] + ',"frame_data":['
+        step = max(1, int((status.get('led_info') or {}).get('leds_per_strip') or 1))
+        for start in range(0, len(frame), step):
+            chunk = encode(frame[start:start + step])[1:-1]
+            yield chunk if start == 0 else ',' + chunk
+        yield ']}'
+
+    def _acquire_frame_stream(self) -> bool:
+        """Claim one of the ``FRAME_STREAM_MAX_CLIENTS`` live stream slots."""
+        with self._frame_stream_lock:
+            if self._frame_stream_clients >= FRAME_STREAM_MAX_CLIENTS:
+                return False
+            self._frame_stream_clients += 1
+            return True
+
+    def _release_frame_stream(self) -> None:
+        with self._frame_stream_lock:
+            self._frame_stream_clients -= 1
+
+    def _frame_events(self) -> Iterator[str]:
+        """Yield one SSE event per new status frame, plus periodic keep-alives.
+
+        Each event carries the status payload with the pixels as base64 packed
+        RGB bytes under ``frame_rgb`` instead of ``frame_data`` triplets.
+        """
+        last_sent = time.monotonic()
+        for status in self._status_frames():
+            now = time.monotonic()
+            if status is not None:
+                last_sent = now
+                encoded = status.pop('frame_data_encoded')
+                status.pop('frame_data', None)
+                rgb = self._stream_frame(encoded, status['frame_encoding'])
+                status['frame_rgb'] = base64.b64encode(rgb).decode('ascii')
+                yield f"data: {self.app.json.encode(status)}\n\n"
+            elif now - last_sent >= FRAME_STREAM_KEEPALIVE_SECONDS:
+                last_sent = now
+                yield ": keep-alive\n\n"
+
+    def _frame_packets(self) -> Iterator[bytes]:
+        """Yield one binary frame packet (see ``pack_frame_packet``) per new frame.
+
+        An empty packet goes out after ``FRAME_STREAM_KEEPALIVE_SECONDS`` of
+        silence so a vanished client fails a send and frees its stream slot;
+        ``unpack_frame_packet`` reads it as no pixels.
+        """
+        last_sent = time.monotonic()
+        for status in self._status_frames():
+            now = time.monotonic()
+            if status is not None:
+                last_sent = now
+                yield pack_frame_packet(
+                    self._stream_frame(status['frame_data_encoded'], status['frame_encoding'])
+                )
+            elif now - last_sent >= FRAME_STREAM_KEEPALIVE_SECONDS:
+                last_sent = now
+                yield b''
+
+    def _status_frames(self) -> Iterator[Optional[Dict[str, Any]]]:
+        """Wait on the shared status feed, yielding each new write once.
+
+        ``None`` is yielded for polls that found nothing new, so consumers get
+        a chance to send keep-alives. Each yielded payload is the caller's own
+        shallow copy.
+        """
+        seen = 0
+        while True:
+            with self._frame_feed:
+                self._poll_frame_feed()
+                if self._frame_feed_seq == seen:
+                    self._frame_feed.wait(FRAME_STREAM_POLL_SECONDS)
+                status = None
+                if self._frame_feed_seq != seen:
+                    seen = self._frame_feed_seq
+                    status = dict(self._frame_feed_status)
+            yield status
+
+    def _poll_frame_feed(self) -> None:
+        """Publish the controller's latest write if a poll is due; hold ``_frame_feed``."""
+        now = time.monotonic()
+        if now - self._frame_feed_polled_at < FRAME_STREAM_POLL_SECONDS:
+            return
+        self._frame_feed_polled_at = now
+        # Compare the raw write first: normalizing also reads deployment.json.
+        raw_status = self.control_channel.read_status() or {}
+        key = (
+            raw_status.get('written_at'),
+            raw_status.get('updated_at'),
+            raw_status.get('frame_count'),
+            raw_status.get('frame_data_encoded'),
+        )
+        if key == self._frame_feed_key:
+            return
+        self._frame_feed_key = key
+        # Stream threads must not touch the preview manager, which
+        # /api/preview renders share.
+        self._frame_feed_status = self._normalize_status(raw_status, sync_preview=False)
+        self._frame_feed_seq += 1
+        self._frame_feed.notify_all()
+
+    def _stream_frame(self, encoded: str, encoding: Optional[str]) -> bytes:
+        """Unpack a status frame to RGB bytes once, however many clients listen."""
+        cached_encoded, cached_encoding, frame = self._stream_frame_cache
+        if encoded != cached_encoded or encoding != cached_encoding:
+            frame = decode_frame_bytes(encoded, encoding)
+            self._stream_frame_cache = (encoded, encoding, frame)
+        return frame
+
     def _deploy_timestamp(self) -> Optional[float]:
         """Read the most recent successful fast-deploy timestamp from disk."""
         try:
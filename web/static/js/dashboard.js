@@ -18,7 +18,12 @@
             this.renderTimer = null;
             this.fetchInFlight = false;
             this.lastFrameData = null;
+            this.paintedColors = null;
             this.previewParams = null;
+            // Live frames arrive over /api/frame/stream where the browser
+            // supports it; polling remains for previews and as a fallback.
+            this.frameStream = null;
+            this.frameStreamFailed = IS_LOCAL_DASHBOARD || typeof EventSource === 'undefined';
 
             // LED configuration - will be updated from server
             this.stripCount = Number.isFinite(INITIAL_STRIP_COUNT) && INITIAL_STRIP_COUNT > 0 ? INITIAL_STRIP_COUNT : 1;
@@ -48,13 +53,22 @@
         }
 
         async initialize() {
-            await this.syncLayoutFromStatus();
+            // The page template embeds the layout; only ask the server when it
+            // did not. Each frame's led_info still corrects a stale layout.
+            if (!this.hasPageLayout()) {
+                await this.syncLayoutFromStatus();
+            }
             this.setupCanvas();
             this.syncDisplayWidth();
             requestAnimationFrame(() => this.syncDisplayWidth());
             this.startRendering();
         }
 
+        hasPageLayout() {
+            return Number.isFinite(INITIAL_STRIP_COUNT) && INITIAL_STRIP_COUNT > 0 &&
+                Number.isFinite(INITIAL_LEDS_PER_STRIP) && INITIAL_LEDS_PER_STRIP > 0;
+        }
+
         applyLedInfo(ledInfo) {
             if (!ledInfo || typeof ledInfo !== 'object') {
                 return false;
@@ -112,6 +126,8 @@
             const gridPixelHeight = this.ledsPerStrip * (this.actualLedSize + this.actualLedSpacing);
             this.canvas.width = Math.max(1, Math.ceil(gridPixelWidth));
             this.canvas.height = Math.max(1, Math.ceil(gridPixelHeight));
+            // Resizing wipes the canvas, so the next frame must paint in full.
+            this.paintedColors = null;
             this.syncDisplayWidth();
         }
 
@@ -191,6 +207,10 @@
         togglePreviewMode() {
             this.previewMode = !this.previewMode;
             console.log(`Preview mode: ${this.previewMode ? 'ON' : 'OFF'}`);
+            if (this.frameStream) {
+                this.closeFrameStream();
+                this.scheduleNextFrame();
+            }
 
             // Update status display
             this.updateStatusDisplay();
@@ -203,23 +223,47 @@
                 this.applyLedInfo(frameData.led_info);
             }
 
-            if (!frameData || !Array.isArray(frameData.frame_data)) {
+            // Streamed frames carry packed RGB bytes; polled ones carry triplets.
+            const bytes = frameData && frameData.frame_bytes instanceof Uint8Array
+                ? frameData.frame_bytes
+                : null;
+            if (!bytes && (!frameData || !Array.isArray(frameData.frame_data))) {
                 this.renderNoAnimation();
                 return;
             }
 
-            // Clear canvas
-            this.ctx.fillStyle = '#000000';
-            this.ctx.fillRect(0, 0, this.canvas.width, this.canvas.height);
+            // Only LEDs whose colour changed since the last paint are redrawn;
+            // the canvas is cleared when there is no previous paint to diff.
+            const colors = frameData.frame_data;
+            const length = bytes ? Math.floor(bytes.length / 3) : colors.length;
+            const count = Math.min(length, this.stripCount * this.ledsPerStrip);
+            let painted = this.paintedColors;
+            if (!painted || painted.length !== count) {
+                this.ctx.fillStyle = '#000000';
+                this.ctx.fillRect(0, 0, this.canvas.width, this.canvas.height);
+                painted = new Int32Array(count).fill(-1);
+                this.paintedColors = painted;
+            }
 
             // Render LEDs
-            const colors = frameData.frame_data;
             for (let strip = 0; strip < this.stripCount; strip++) {
                 for (let led = 0; led < this.ledsPerStrip; led++) {
                     const pixelIndex = strip * this.ledsPerStrip + led;
-                    if (pixelIndex < colors.length) {
-                        const [r, g, b] = colors[pixelIndex];
-                        this.renderLED(strip, led, r, g, b);
+                    if (pixelIndex < count) {
+                        let r, g, b;
+                        if (bytes) {
+                            const offset = pixelIndex * 3;
+                            r = bytes[offset];
+                            g = bytes[offset + 1];
+                            b = bytes[offset + 2];
+                        } else {
+                            [r, g, b] = colors[pixelIndex];
+                        }
+                        const packed = (r << 16) | (g << 8) | b;
+                        if (painted[pixelIndex] !== packed) {
+                            painted[pixelIndex] = packed;
+                            this.renderLED(strip, led, r, g, b);
+                        }
                     }
                 }
             }
@@ -238,6 +282,7 @@
         }
 
         renderNoAnimation() {
+            this.paintedColors = null;
             // Clear canvas and show "no animation" state
             this.ctx.fillStyle = '#1a1a1a';
             this.ctx.fillRect(0, 0, this.canvas.width, this.canvas.height);
@@ -269,9 +314,64 @@
             }
         }
 
+        openFrameStream() {
+            if (this.frameStream) return true;
+            if (this.frameStreamFailed) return false;
+
+            const stream = new EventSource('/api/frame/stream');
+            let received = false;
+            stream.onmessage = (event) => {
+                received = true;
+                let frameData;
+                try {
+                    frameData = JSON.parse(event.data);
+                } catch (error) {
+                    console.warn('Dropping malformed streamed frame', error);
+                    return;
+                }
+                frameData.frame_bytes = this.decodeFrameBytes(frameData.frame_rgb);
+                this.lastFrameData = frameData;
+                this.renderFrame(frameData);
+                this.updateStatusDisplay(frameData);
+            };
+            stream.onerror = () => {
+                // EventSource reconnects by itself once it has worked; a stream
+                // that never delivered a frame is unsupported, so poll instead.
+                if (received && stream.readyState !== EventSource.CLOSED) return;
+                this.frameStreamFailed = true;
+                this.closeFrameStream();
+                this.scheduleNextFrame();
+            };
+            this.frameStream = stream;
+            return true;
+        }
+
+        closeFrameStream() {
+            if (!this.frameStream) return;
+            this.frameStream.close();
+            this.frameStream = null;
+        }
+
+        decodeFrameBytes(encoded) {
+            if (typeof encoded !== 'string' || !encoded) {
+                return new Uint8Array(0);
+            }
+            const binary = atob(encoded);
+            const bytes = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) {
+                bytes[i] = binary.charCodeAt(i);
+            }
+            return bytes;
+        }
+
         async renderLoop() {
             if (!this.isRunning) return;
 
+            if (!this.previewMode && this.openFrameStream()) {
+                // The stream's message handler renders from here on.
+                return;
+            }
+
             if (this.fetchInFlight) {
                 this.scheduleNextFrame();
                 return;
@@ -337,6 +437,7 @@
 
         stopRendering() {
             this.isRunning = false;
+            this.closeFrameStream();
             if (this.renderTimer) {
                 if (IS_LOCAL_DASHBOARD) cancelAnimationFrame(this.renderTimer);
                 else clearTimeout(this.renderTimer);
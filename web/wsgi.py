@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for running the web/preview process under a production server.
+
+Example (web mode only; the controller process still owns the hardware)::
+
+    gunicorn -w $(nproc) -k gevent --worker-connections 1000 \
+        -b 0.0.0.0:5000 web.wsgi:application
+
+The web process never opens SPI: it drives a PreviewLEDController and talks to
+the controller through the status/control files, so any number of workers can
+serve the same wall. Layout and file paths come from the environment, with the
+same defaults as ``scripts/start_server.py --mode web``:
+
+    LEDGRID_CONTROL_FILE, LEDGRID_STATUS_FILE, LEDGRID_ANIMATIONS_DIR,
+    LEDGRID_STRIPS, LEDGRID_LEDS_PER_STRIP, LEDGRID_ANIMATION_SPEED_SCALE
+
+Importing this module is cheap: each worker builds its app (animation
+manager, plugins, and its own runtime preview worker) on its first request.
+Set LEDGRID_DISABLE_PREVIEW_WORKER=1 to skip the preview worker.
+"""
+
+import os
+import threading
+
+from animation.core.defaults import DEFAULT_ANIMATION_SPEED_SCALE
+from drivers.led_layout import DEFAULT_LEDS_PER_STRIP, default_strip_count
+from ipc.control_channel import FileControlChannel
+from web.app import create_app
+
+
+def _env_number(key: str, cast, default):
+    raw = os.environ.get(key)
+    if raw is None:
+        return default
+    try:
+        return cast(raw)
+    except (TypeError, ValueError):
+        return default
+
+
+_app = None
+_app_lock = threading.Lock()
+
+
+def _build_app():
+    channel = FileControlChannel(
+        control_path=os.environ.get("LEDGRID_CONTROL_FILE", "run_state/control.json"),
+        status_path=os.environ.get("LEDGRID_STATUS_FILE", "run_state/status.json"),
+    )
+    web_interface = create_app(
+        control_channel=channel,
+        strips=_env_number("LEDGRID_STRIPS", int, default_strip_count()),
+        leds_per_strip=_env_number("LEDGRID_LEDS_PER_STRIP", int, DEFAULT_LEDS_PER_STRIP),
+        animations_dir=os.environ.get("LEDGRID_ANIMATIONS_DIR") or None,
+        animation_speed_scale=_env_number(
+            "LEDGRID_ANIMATION_SPEED_SCALE", float, DEFAULT_ANIMATION_SPEED_SCALE
+        ),
+    )
+    return web_interface.app
+
+
+def wsgi_app():
+    """Return this worker process's Flask app, building it on first use."""
+    global _app
+    if _app is None:
+        with _app_lock:
+            if _app is None:
+                _app = _build_app()
+    return _app
+
+
+def application(environ, start_response):
+    """WSGI callable that defers app construction until the first request."""
+    return wsgi_app()(environ, start_response)